@@ -6,39 +6,13 @@ Command-line interface for password security analysis.
 
 import sys
 import argparse
-from .cli.commands import cmd_check, cmd_generate, cmd_batch
+from typing import Callable, Dict, List, Optional
 
 VERSION = "1.0.0"
 
 
-def main() -> int:
-    """
-    Main CLI entry point.
-
-    Parses command-line arguments and routes to appropriate command handler.
-
-    Returns:
-        Exit code (0 for success, non-zero for errors)
-    """
-    # Main parser
-    parser = argparse.ArgumentParser(
-        prog="securepass",
-        description="SecurePass Toolkit - Password Security Analysis Suite",
-        epilog="For more information, visit: https://github.com/yourusername/securepass-toolkit",
-    )
-
-    parser.add_argument(
-        "--version", action="version", version=f"SecurePass Toolkit v{VERSION}"
-    )
-
-    # Subcommand parsers
-    subparsers = parser.add_subparsers(
-        dest="command", help="Available commands", required=True
-    )
-
-    # ========================================
-    # CHECK command
-    # ========================================
+def _build_check(subparsers: "argparse._SubParsersAction") -> None:
+    """Register the 'check' subcommand and its arguments."""
     check_parser = subparsers.add_parser(
         "check",
         help="Analyze password strength interactively",
@@ -55,9 +29,9 @@ def main() -> int:
         "--verbose", "-v", action="store_true", help="Show additional analysis details"
     )
 
-    # ========================================
-    # GENERATE command
-    # ========================================
+
+def _build_generate(subparsers: "argparse._SubParsersAction") -> None:
+    """Register the 'generate' subcommand and its arguments."""
     generate_parser = subparsers.add_parser(
         "generate",
         help="Generate a secure random password",
@@ -91,9 +65,9 @@ def main() -> int:
         help="Avoid ambiguous characters (0, O, 1, l, I)",
     )
 
-    # ========================================
-    # BATCH command
-    # ========================================
+
+def _build_batch(subparsers: "argparse._SubParsersAction") -> None:
+    """Register the 'batch' subcommand and its arguments."""
     batch_parser = subparsers.add_parser(
         "batch",
         help="Analyze multiple passwords from a file",
@@ -119,19 +93,142 @@ def main() -> int:
         help="Skip breach database checking (much faster for large batches)",
     )
 
-    # Parse arguments
-    args = parser.parse_args()
 
-    # Route to appropriate command handler
+# Subcommand name -> parser builder, in help-listing order
+_BUILDERS: Dict[str, Callable[["argparse._SubParsersAction"], None]] = {
+    "check": _build_check,
+    "generate": _build_generate,
+    "batch": _build_batch,
+}
+
+
+def _build_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI argument parser.
+
+    Only the subparser for the requested command is constructed. When the
+    command cannot be determined from ``argv`` (``--help``, ``--version``,
+    a typo, or no arguments), every subparser is built so that help and
+    error messages list all available commands.
+
+    Args:
+        argv: Command-line arguments, excluding the program name
+              (default: sys.argv[1:])
+
+    Returns:
+        Configured ArgumentParser
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Main parser
+    parser = argparse.ArgumentParser(
+        prog="securepass",
+        description="SecurePass Toolkit - Password Security Analysis Suite",
+        epilog="For more information, visit: https://github.com/yourusername/securepass-toolkit",
+    )
+
+    parser.add_argument(
+        "--version", action="version", version=f"SecurePass Toolkit v{VERSION}"
+    )
+
+    # Subcommand parsers
+    subparsers = parser.add_subparsers(
+        dest="command", help="Available commands", required=True
+    )
+
+    command = argv[0] if argv else None
+    if command in _BUILDERS:
+        _BUILDERS[command](subparsers)
+    else:
+        # Help, version, or unknown command: build everything (rare path)
+        for builder in _BUILDERS.values():
+            builder(subparsers)
+
+    return parser
+
+
+# Boolean 'generate' flags understood by the fast path -> Namespace attribute
+_GENERATE_FLAGS = {
+    "--no-symbols": "no_symbols",
+    "--no-uppercase": "no_uppercase",
+    "--no-digits": "no_digits",
+    "--avoid-ambiguous": "avoid_ambiguous",
+}
+
+
+def _parse_generate_fast(argv: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse 'generate' options by hand, without building any parser.
+
+    Handles the exact flags of the generate subcommand plus
+    ``--length N``, ``-l N`` and ``--length=N`` with a plain decimal N.
+    Anything else (help, abbreviations, invalid values) returns None so
+    the caller falls back to argparse and its usual messages.
+
+    Args:
+        argv: Arguments following the 'generate' command
+
+    Returns:
+        Namespace equivalent to argparse's result, or None
+    """
+    values = {"command": "generate", "length": 16}
+    values.update(dict.fromkeys(_GENERATE_FLAGS.values(), False))
+
+    remaining = iter(argv)
+    for arg in remaining:
+        if arg in _GENERATE_FLAGS:
+            values[_GENERATE_FLAGS[arg]] = True
+            continue
+
+        if arg in ("--length", "-l"):
+            length = next(remaining, "")
+        elif arg.startswith("--length="):
+            length = arg[len("--length=") :]
+        else:
+            return None
+
+        if not (length.isascii() and length.isdigit()):
+            return None
+        values["length"] = int(length)
+
+    return argparse.Namespace(**values)
+
+
+def main() -> int:
+    """
+    Main CLI entry point.
+
+    Parses command-line arguments and routes to appropriate command handler.
+
+    Returns:
+        Exit code (0 for success, non-zero for errors)
+    """
+    argv = sys.argv[1:]
+
+    # Fast path: a plain `securepass generate [flags]` skips argparse
+    args = _parse_generate_fast(argv[1:]) if argv[:1] == ["generate"] else None
+
+    if args is None:
+        # Parse arguments
+        args = _build_parser(argv).parse_args(argv)
+
+    # Route to appropriate command handler (imported lazily, see cli.commands)
     try:
         if args.command == "check":
+            from .cli.commands import cmd_check
+
             return cmd_check(args)
         elif args.command == "generate":
+            from .cli.commands import cmd_generate
+
             return cmd_generate(args)
         elif args.command == "batch":
+            from .cli.commands import cmd_batch
+
             return cmd_batch(args)
         else:
-            parser.print_help()
+            _build_parser([]).print_help()
             return 1
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user")
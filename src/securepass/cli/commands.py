@@ -7,17 +7,30 @@ Implements the logic for each CLI command:
 - batch: Batch file analysis
 """
 
-import getpass
-import sys
-import json
-import csv
-from typing import List
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Union
 from argparse import Namespace
 
-from ..core.analyzer import analyze_password
-from ..core.generator import generate_password
-from ..models.analysis import PasswordAnalysis
-from .formatters import format_analysis_text, format_analysis_json, format_batch_summary
+# Worker threads for breach-checked batches (network-bound HIBP lookups)
+BATCH_THREAD_WORKERS = 32
+
+# Passwords read from the batch file and in flight at any one time
+BATCH_WINDOW = 1024
+
+# Distinct analyses kept for reuse when a batch file repeats passwords
+BATCH_CACHE_SIZE = 100_000
+
+# Rows buffered per write when exporting CSV
+CSV_CHUNK_ROWS = 4096
+
+# Reports encoded per write when exporting text
+TEXT_CHUNK_RECORDS = 256
+
+# Heavy dependencies (analyzer, formatters/colorama, csv, json, getpass) are
+# imported inside the handlers that need them so that CLI startup only pays
+# for the command actually being run.
+if TYPE_CHECKING:
+    from ..models.analysis import PasswordAnalysis
 
 
 def cmd_check(args: Namespace) -> int:
@@ -35,6 +48,11 @@ def cmd_check(args: Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    import getpass
+
+    from ..core.analyzer import analyze_password
+    from .formatters import format_analysis_text
+
     try:
         # Secure password input (no echo to terminal)
         print("Enter password to analyze (input hidden):")
@@ -82,6 +100,9 @@ def cmd_generate(args: Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    from ..core.analyzer import analyze_password
+    from ..core.generator import generate_password
+
     try:
         # Generate password with specified parameters
         password = generate_password(
@@ -141,11 +162,18 @@ def cmd_batch(args: Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    import os
+    from collections import OrderedDict
+    from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+    from contextlib import ExitStack
+
+    from .formatters import format_batch_summary
+
     try:
-        # Read passwords from file
+        # Count passwords in a first streaming pass (for the progress
+        # indicator) without holding the file contents in memory
         try:
-            with open(args.file, "r", encoding="utf-8") as f:
-                passwords = [line.strip() for line in f if line.strip()]
+            total = sum(1 for _ in _iter_passwords(args.file))
         except FileNotFoundError:
             print(f"Error: File not found: {args.file}")
             return 1
@@ -153,30 +181,118 @@ def cmd_batch(args: Namespace) -> int:
             print(f"Error: Permission denied: {args.file}")
             return 1
 
-        if not passwords:
+        if not total:
             print("Error: No passwords found in file")
             return 1
 
-        print(f"\nAnalyzing {len(passwords)} passwords...")
+        print(f"\nAnalyzing {total} passwords...")
         print("Progress: ", end="", flush=True)
 
         # Analyze all passwords
-        results: List[PasswordAnalysis] = []
+        results: List["PasswordAnalysis"] = []
         check_breach_status = not args.no_breach
 
-        for i, password in enumerate(passwords, 1):
-            try:
-                result = analyze_password(
-                    password, check_breach_status=check_breach_status
+        # Breach checks are network-bound, so threads overlap the HIBP
+        # round-trips. Offline analysis is pure CPU work taking tens of
+        # microseconds per password, so it is spread across processes in one
+        # chunk per worker per window, or run in-process on a single CPU
+        # where worker processes only add pickling overhead.
+        workers = os.cpu_count() or 1
+        executor: Optional[Executor] = None
+        session = None
+
+        # Update progress at most ~100 times per run (every 10 passwords for
+        # small files) so printing and flushing never dominates fast runs
+        progress_step = max(10, total // 100)
+
+        # Most recently seen passwords -> analysis, so duplicates (common in
+        # leaked password lists) are analyzed once. Bounded to
+        # BATCH_CACHE_SIZE entries; the passwords are already in memory
+        # while their window is processed.
+        analysis_cache: "OrderedDict[str, PasswordAnalysis]" = OrderedDict()
+
+        i = 0
+        with ExitStack() as stack:
+            if check_breach_status:
+                # requests is only imported when --no-breach is not given
+                from ..core.breach import (
+                    _sha1_hash,
+                    create_session,
+                    fetch_breach_ranges,
                 )
-                results.append(result)
 
-                # Progress indicator
-                if i % 10 == 0 or i == len(passwords):
-                    print(f"{i}/{len(passwords)}", end=" ", flush=True)
-            except Exception as e:
-                print(f"\nWarning: Failed to analyze password #{i}: {e}")
-                continue
+                workers = BATCH_THREAD_WORKERS
+                executor = stack.enter_context(ThreadPoolExecutor(workers))
+                # One HTTP session for the whole run so HIBP connections are
+                # pooled and kept alive across requests
+                session = stack.enter_context(create_session(pool_size=workers))
+            elif workers > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(workers))
+
+            # Stream the file one window at a time so only BATCH_WINDOW
+            # passwords (and their breach ranges) are held in memory
+            for window in _iter_windows(_iter_passwords(args.file), BATCH_WINDOW):
+                # Distinct passwords in this window not already analyzed
+                pending = [
+                    password
+                    for password in dict.fromkeys(window)
+                    if password not in analysis_cache
+                ]
+
+                # Fetch each distinct HIBP hash prefix in the window once, so
+                # passwords sharing a prefix don't repeat the network request
+                # (each password is SHA-1 hashed once, here, and the digest is
+                # reused for both the prefetch and the breach lookup)
+                breach_cache = None
+                hashes: List[Optional[str]] = [None] * len(pending)
+                if check_breach_status:
+                    sha1_hashes = [_sha1_hash(password) for password in pending]
+                    breach_cache = fetch_breach_ranges(
+                        sha1_hashes,
+                        max_workers=BATCH_THREAD_WORKERS,
+                        session=session,
+                    )
+                    hashes = list(sha1_hashes)
+
+                analyze = partial(
+                    _analyze_batch_password,
+                    check_breach_status=check_breach_status,
+                    breach_cache=breach_cache,
+                    http_session=session,
+                )
+                outcomes: Iterator[Union["PasswordAnalysis", Exception]]
+                if executor is None:
+                    outcomes = map(analyze, pending, hashes)
+                else:
+                    chunksize = max(1, len(pending) // workers)
+                    outcomes = executor.map(
+                        analyze, pending, hashes, chunksize=chunksize
+                    )
+                analyzed = dict(zip(pending, outcomes))
+
+                # Collect in file order so results match the input file
+                for password in window:
+                    i += 1
+                    try:
+                        result = analysis_cache.get(password)
+                        if result is None:
+                            outcome = analyzed[password]
+                            if isinstance(outcome, Exception):
+                                raise outcome
+                            result = outcome
+                            analysis_cache[password] = result
+                            if len(analysis_cache) > BATCH_CACHE_SIZE:
+                                analysis_cache.popitem(last=False)
+                        else:
+                            analysis_cache.move_to_end(password)
+                        results.append(result)
+
+                        # Progress indicator
+                        if i % progress_step == 0 or i == total:
+                            print(f"{i}/{total}", end=" ", flush=True)
+                    except Exception as e:
+                        print(f"\nWarning: Failed to analyze password #{i}: {e}")
+                        continue
 
         print("\n")
 
@@ -214,26 +330,159 @@ def cmd_batch(args: Namespace) -> int:
         return 1
 
 
-def _export_json(results: List[PasswordAnalysis], filepath: str) -> None:
-    """Export results to JSON file."""
-    data = [result.to_dict() for result in results]
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+def _analyze_batch_password(
+    password: str, sha1_hex: Optional[str], **kwargs: Any
+) -> Union["PasswordAnalysis", Exception]:
+    """
+    Analyze one batch password, returning any error instead of raising it.
+
+    Module-level so worker processes can unpickle it; returning the error
+    lets a single bad password be reported without aborting its chunk.
+
+    Args:
+        password: The password to analyze
+        sha1_hex: Optional precomputed SHA-1 digest of password
+        **kwargs: Further keyword arguments for analyze_password()
+
+    Returns:
+        The PasswordAnalysis, or the exception analysis raised
+    """
+    from ..core.analyzer import analyze_password
+
+    try:
+        return analyze_password(password, sha1_hex=sha1_hex, **kwargs)
+    except Exception as e:
+        return e
+
+
+def _iter_passwords(filepath: str) -> Iterator[str]:
+    """Yield non-empty, stripped lines from a password file."""
+    with open(filepath, "r", encoding="utf-8") as f:
+        for line in f:
+            password = line.strip()
+            if password:
+                yield password
+
 
+def _iter_windows(passwords: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Group an iterable of passwords into lists of at most ``size`` items."""
+    window: List[str] = []
+    for password in passwords:
+        window.append(password)
+        if len(window) == size:
+            yield window
+            window = []
+    if window:
+        yield window
 
-def _export_csv(results: List[PasswordAnalysis], filepath: str) -> None:
-    """Export results to CSV file."""
-    with open(filepath, "w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(PasswordAnalysis.csv_header())
+
+def _export_json(results: List["PasswordAnalysis"], filepath: str) -> None:
+    """
+    Export results to JSON file.
+
+    Records are serialized and written one at a time instead of building
+    the full list of dicts first. Uses orjson when it is installed (much
+    faster encoder), otherwise the standard library json module.
+    """
+    try:
+        import orjson
+
+        def _dumps(obj: dict) -> bytes:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    except ImportError:
+        import json
+
+        def _dumps(obj: dict) -> bytes:
+            # ensure_ascii=False matches orjson's raw UTF-8 output
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    with open(filepath, "wb") as f:
+        f.write(b"[\n")
+        for i, result in enumerate(results):
+            if i:
+                f.write(b",\n")
+            f.write(_dumps(result.to_dict()))
+        f.write(b"\n]\n")
+
+
+@lru_cache(maxsize=1)
+def _csv_header_bytes() -> bytes:
+    """Encoded CSV header line (built on first export, then reused)."""
+    from ..models.analysis import PasswordAnalysis
+
+    return (",".join(PasswordAnalysis.csv_header()) + "\r\n").encode("utf-8")
+
+
+def _export_csv(results: List["PasswordAnalysis"], filepath: str) -> None:
+    """
+    Export results to CSV file.
+
+    Fields from to_csv_row() are hashes, numbers, ratings and crack time
+    strings, so rows are joined directly and written as UTF-8 bytes in
+    chunks through a large buffer. A row is routed through csv.writer for
+    quoting only if one of its fields contains a delimiter, quote or line
+    break.
+    """
+    import csv
+    import io
+
+    header = _csv_header_bytes()
+    separators = header.count(b",")
+
+    # Only used for the rare row that needs quoting
+    quoted = io.StringIO()
+    quoter = csv.writer(quoted)
+
+    with open(filepath, "wb") as raw, io.BufferedWriter(raw, 1 << 20) as f:
+        f.write(header)
+
+        lines: List[str] = []
         for result in results:
-            writer.writerow(result.to_csv_row())
+            line = ",".join(result.to_csv_row())
+            if (
+                line.count(",") != separators
+                or '"' in line
+                or "\n" in line
+                or "\r" in line
+            ):
+                quoted.seek(0)
+                quoted.truncate()
+                quoter.writerow(result.to_csv_row())
+                lines.append(quoted.getvalue())
+            else:
+                lines.append(line + "\r\n")
+
+            if len(lines) >= CSV_CHUNK_ROWS:
+                f.write("".join(lines).encode("utf-8"))
+                lines.clear()
+
+        f.write("".join(lines).encode("utf-8"))
+
+
+def _export_text(results: List["PasswordAnalysis"], filepath: str) -> None:
+    """
+    Export results to text file.
+
+    Reports are joined and UTF-8 encoded TEXT_CHUNK_RECORDS at a time and
+    written through a large binary buffer, avoiding per-write text-mode
+    encoding and many small writes.
+    """
+    import io
+
+    from .formatters import format_analysis_text
 
+    separator = "\n" + "=" * 70 + "\n\n"
 
-def _export_text(results: List[PasswordAnalysis], filepath: str) -> None:
-    """Export results to text file."""
-    with open(filepath, "w", encoding="utf-8") as f:
+    with open(filepath, "wb") as raw, io.BufferedWriter(raw, 1 << 20) as f:
+        chunk: List[str] = []
         for i, result in enumerate(results, 1):
-            f.write(f"Password #{i}\n")
-            f.write(format_analysis_text(result, verbose=True))
-            f.write("\n" + "=" * 70 + "\n\n")
+            chunk.append(
+                f"Password #{i}\n{format_analysis_text(result, verbose=True)}"
+                f"{separator}"
+            )
+            if len(chunk) >= TEXT_CHUNK_RECORDS:
+                f.write("".join(chunk).encode("utf-8"))
+                chunk.clear()
+
+        f.write("".join(chunk).encode("utf-8"))
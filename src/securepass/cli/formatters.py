@@ -4,17 +4,28 @@ CLI Output Formatters Module
 Formats password analysis results for display in terminal with colors.
 """
 
+from operator import attrgetter
 from typing import List
+import heapq
+import importlib.util
 import json
-
-try:
+import sys
+
+# Colors are only emitted when writing to a terminal and colorama is
+# installed; redirected output (e.g. `securepass batch ... > report.txt`)
+# never imports or initializes colorama.
+COLORAMA_AVAILABLE = (
+    sys.stdout is not None
+    and sys.stdout.isatty()
+    and importlib.util.find_spec("colorama") is not None
+)
+
+if COLORAMA_AVAILABLE:
     from colorama import init, Fore, Style
 
     init(autoreset=True)
-    COLORAMA_AVAILABLE = True
-except ImportError:
-    COLORAMA_AVAILABLE = False
 
+else:
     # Fallback: no colors
     class Fore:  # type: ignore[no-redef]
         RED = YELLOW = GREEN = BLUE = CYAN = WHITE = RESET = ""
@@ -23,7 +34,41 @@ except ImportError:
         BRIGHT = DIM = RESET_ALL = ""
 
 
-from ..models.analysis import PasswordAnalysis
+from ..models.analysis import PasswordAnalysis, Rating
+
+# Static report framing (each block ends with "\n", see format_analysis_text)
+_SEP = "=" * 70
+_ANALYSIS_HEADER = (
+    f"\n{Style.BRIGHT}{_SEP}\n{Style.BRIGHT}  PASSWORD STRENGTH ANALYSIS\n"
+    f"{Style.BRIGHT}{_SEP}\n"
+)
+_SUMMARY_HEADER = (
+    f"\n{Style.BRIGHT}{_SEP}\n{Style.BRIGHT}  BATCH ANALYSIS SUMMARY\n"
+    f"{Style.BRIGHT}{_SEP}\n"
+)
+_FOOTER = f"{_SEP}\n"
+
+# Color for every possible score (0-100), see _get_color_for_score
+_SCORE_COLORS = (
+    (Fore.RED,) * 40  # 0-39: weak
+    + (Fore.YELLOW,) * 30  # 40-69: moderate
+    + (Fore.GREEN,) * 20  # 70-89: strong
+    + (Fore.BLUE,) * 11  # 90-100: very strong
+)
+
+# Criteria checklist icons and labels (built once, reused for every report)
+_TICK = f"{Fore.GREEN}✓{Style.RESET_ALL}"
+_CROSS = f"{Fore.RED}✗{Style.RESET_ALL}"
+_CRITERIA_LABELS = (
+    ("min_length", "Minimum length (12+ characters)"),
+    ("has_lowercase", "Contains lowercase letters"),
+    ("has_uppercase", "Contains uppercase letters"),
+    ("has_digits", "Contains digits"),
+    ("has_symbols", "Contains symbols"),
+    ("no_common_patterns", "No common patterns"),
+    ("no_dictionary_words", "Not a dictionary word"),
+    ("no_sequential_chars", "No sequential characters"),
+)
 
 
 def _get_color_for_score(score: int) -> str:
@@ -42,14 +87,7 @@ def _get_color_for_score(score: int) -> str:
     Returns:
         Colorama color code
     """
-    if score < 40:
-        return Fore.RED
-    elif score < 70:
-        return Fore.YELLOW
-    elif score < 90:
-        return Fore.GREEN
-    else:
-        return Fore.BLUE
+    return _SCORE_COLORS[min(max(score, 0), 100)]
 
 
 def format_analysis_text(analysis: PasswordAnalysis, verbose: bool = False) -> str:
@@ -70,99 +108,74 @@ def format_analysis_text(analysis: PasswordAnalysis, verbose: bool = False) -> s
     Returns:
         Formatted string ready for terminal display
     """
+    bright = Style.BRIGHT
+    reset = Style.RESET_ALL
     color = _get_color_for_score(analysis.strength_score)
-
-    # Header
-    output = []
-    output.append("")
-    output.append(f"{Style.BRIGHT}{'='*70}")
-    output.append(f"{Style.BRIGHT}  PASSWORD STRENGTH ANALYSIS")
-    output.append(f"{Style.BRIGHT}{'='*70}")
-    output.append("")
-
-    # Strength score with color
     rating_display = analysis.strength_rating.replace("_", " ").upper()
-    output.append(
-        f"{Style.BRIGHT}Strength Score: {color}{analysis.strength_score}/100 [{rating_display}]{Style.RESET_ALL}"
-    )
-    output.append("")
-
-    # Entropy and metrics
-    output.append(f"{Style.BRIGHT}Entropy Analysis:")
-    output.append(f"  Entropy: {analysis.entropy_bits:.1f} bits")
-    output.append(f"  Character Pool: {analysis.character_pool_size} characters")
-    output.append(f"  Password Length: {analysis.length} characters")
-    output.append("")
-
-    # Crack time estimates
-    output.append(f"{Style.BRIGHT}Estimated Crack Time:")
-    online_time = analysis.estimated_crack_time.get(
-        "online_attack_100_per_second", "N/A"
-    )
-    offline_time = analysis.estimated_crack_time.get(
-        "offline_attack_10B_per_second", "N/A"
-    )
-    output.append(f"  Online Attack (100/sec):  {online_time}")
-    output.append(f"  Offline Attack (10B/sec): {offline_time}")
-    output.append("")
-
-    # Criteria checklist
-    output.append(f"{Style.BRIGHT}Security Criteria:")
-    criteria_labels = {
-        "min_length": "Minimum length (12+ characters)",
-        "has_lowercase": "Contains lowercase letters",
-        "has_uppercase": "Contains uppercase letters",
-        "has_digits": "Contains digits",
-        "has_symbols": "Contains symbols",
-        "no_common_patterns": "No common patterns",
-        "no_dictionary_words": "Not a dictionary word",
-        "no_sequential_chars": "No sequential characters",
-    }
-
-    for key, label in criteria_labels.items():
-        passed = analysis.criteria_met.get(key, False)
-        if passed:
-            icon = f"{Fore.GREEN}✓{Style.RESET_ALL}"
-        else:
-            icon = f"{Fore.RED}✗{Style.RESET_ALL}"
-        output.append(f"  {icon} {label}")
-    output.append("")
+    crack_time = analysis.estimated_crack_time
+    criteria = analysis.criteria_met
+
+    # Each block ends with "\n" so joining on "\n" leaves a blank line
+    # between sections
+    output = [
+        # Header
+        _ANALYSIS_HEADER,
+        # Strength score with color
+        f"{bright}Strength Score: {color}{analysis.strength_score}/100 [{rating_display}]{reset}\n",
+        # Entropy and metrics
+        f"{bright}Entropy Analysis:\n"
+        f"  Entropy: {analysis.entropy_bits:.1f} bits\n"
+        f"  Character Pool: {analysis.character_pool_size} characters\n"
+        f"  Password Length: {analysis.length} characters\n",
+        # Crack time estimates
+        f"{bright}Estimated Crack Time:\n"
+        f"  Online Attack (100/sec):  {crack_time.get('online_attack_100_per_second', 'N/A')}\n"
+        f"  Offline Attack (10B/sec): {crack_time.get('offline_attack_10B_per_second', 'N/A')}\n",
+        # Criteria checklist
+        f"{bright}Security Criteria:\n"
+        + "".join(
+            f"  {_TICK if criteria.get(key, False) else _CROSS} {label}\n"
+            for key, label in _CRITERIA_LABELS
+        ),
+    ]
 
     # Breach status
-    output.append(f"{Style.BRIGHT}Breach Database Check:")
-    if analysis.breach_status.get("checked", False):
-        if analysis.breach_status.get("found", False):
-            count = analysis.breach_status.get("occurrence_count", 0)
-            output.append(
-                f"  {Fore.RED}⚠️  FOUND in {count:,} data breaches!{Style.RESET_ALL}"
-            )
+    breach_status = analysis.breach_status
+    if breach_status.get("checked", False):
+        if breach_status.get("found", False):
+            count = breach_status.get("occurrence_count", 0)
             output.append(
-                f"  {Fore.RED}    ⚠️  Change this password immediately!{Style.RESET_ALL}"
+                f"{bright}Breach Database Check:\n"
+                f"  {Fore.RED}⚠️  FOUND in {count:,} data breaches!{reset}\n"
+                f"  {Fore.RED}    ⚠️  Change this password immediately!{reset}\n"
             )
         else:
             output.append(
-                f"  {Fore.GREEN}✓ Not found in breach database{Style.RESET_ALL}"
+                f"{bright}Breach Database Check:\n"
+                f"  {Fore.GREEN}✓ Not found in breach database{reset}\n"
             )
     else:
-        output.append(f"  {Fore.YELLOW}⚠ Breach check skipped{Style.RESET_ALL}")
-    output.append("")
+        output.append(
+            f"{bright}Breach Database Check:\n"
+            f"  {Fore.YELLOW}⚠ Breach check skipped{reset}\n"
+        )
 
     # Recommendations
     if analysis.recommendations:
-        output.append(f"{Style.BRIGHT}Recommendations:")
-        for rec in analysis.recommendations:
-            output.append(f"  • {rec}")
-        output.append("")
+        output.append(
+            f"{bright}Recommendations:\n"
+            + "".join(f"  • {rec}\n" for rec in analysis.recommendations)
+        )
 
     # Verbose mode: additional details
     if verbose:
-        output.append(f"{Style.BRIGHT}Additional Details:")
-        output.append(f"  Password Hash (SHA-256): {analysis.password_hash[:16]}...")
-        output.append(f"  Analysis Timestamp: {analysis.timestamp}")
-        output.append("")
+        output.append(
+            f"{bright}Additional Details:\n"
+            f"  Password Hash (SHA-256): {analysis.password_hash[:16]}...\n"
+            f"  Analysis Timestamp: {analysis.timestamp}\n"
+        )
 
-    output.append("=" * 70)
-    output.append("")
+    output.append(_FOOTER)
 
     return "\n".join(output)
 
@@ -202,25 +215,32 @@ def format_batch_summary(results: List[PasswordAnalysis]) -> str:
         return "No passwords analyzed."
 
     output = []
-    output.append("")
-    output.append(f"{Style.BRIGHT}{'='*70}")
-    output.append(f"{Style.BRIGHT}  BATCH ANALYSIS SUMMARY")
-    output.append(f"{Style.BRIGHT}{'='*70}")
-    output.append("")
+    output.append(_SUMMARY_HEADER)
 
     # Total count
     total = len(results)
     output.append(f"{Style.BRIGHT}Total Passwords Analyzed: {total}")
     output.append("")
 
-    # Count by rating
-    ratings = {"weak": 0, "moderate": 0, "strong": 0, "very_strong": 0}
+    # Single pass over results: rating counts (indexed by Rating value),
+    # breach count and metric sums
+    counts = [0] * len(Rating)
     breached_count = 0
+    score_sum = 0
+    entropy_sum = 0.0
+    length_sum = 0
 
     for result in results:
-        ratings[result.strength_rating] += 1
+        # -1 marks a rating outside the Rating enum; don't tally it
+        if result.strength_rating_id >= 0:
+            counts[result.strength_rating_id] += 1
         if result.breach_status.get("found", False):
             breached_count += 1
+        score_sum += result.strength_score
+        entropy_sum += result.entropy_bits
+        length_sum += result.length
+
+    ratings = {rating.name.lower(): counts[rating] for rating in Rating}
 
     output.append(f"{Style.BRIGHT}Strength Distribution:")
     output.append(
@@ -244,9 +264,8 @@ def format_batch_summary(results: List[PasswordAnalysis]) -> str:
     )
     output.append("")
 
-    # Top 5 weakest passwords
-    sorted_results = sorted(results, key=lambda x: x.strength_score)
-    weakest = sorted_results[: min(5, len(sorted_results))]
+    # Top 5 weakest passwords (partial selection, no full sort)
+    weakest = heapq.nsmallest(5, results, key=attrgetter("strength_score"))
 
     output.append(f"{Style.BRIGHT}Weakest Passwords (Top 5):")
     for i, result in enumerate(weakest, 1):
@@ -258,9 +277,9 @@ def format_batch_summary(results: List[PasswordAnalysis]) -> str:
     output.append("")
 
     # Average metrics
-    avg_score = sum(r.strength_score for r in results) / total
-    avg_entropy = sum(r.entropy_bits for r in results) / total
-    avg_length = sum(r.length for r in results) / total
+    avg_score = score_sum / total
+    avg_entropy = entropy_sum / total
+    avg_length = length_sum / total
 
     output.append(f"{Style.BRIGHT}Average Metrics:")
     output.append(f"  Average Score:   {avg_score:.1f}/100")
@@ -268,7 +287,6 @@ def format_batch_summary(results: List[PasswordAnalysis]) -> str:
     output.append(f"  Average Length:  {avg_length:.1f} characters")
     output.append("")
 
-    output.append("=" * 70)
-    output.append("")
+    output.append(_FOOTER)
 
     return "\n".join(output)
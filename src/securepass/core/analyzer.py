@@ -9,24 +9,72 @@ Main orchestration module that coordinates all password analysis components:
 - Recommendation generation
 """
 
+import atexit
+import bisect
 import hashlib
-import string
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..models.analysis import PasswordAnalysis
-from .entropy import calculate_entropy, estimate_crack_time
-from .breach import check_breach
+from .entropy import (
+    CLASS_DIGIT,
+    CLASS_LOWER,
+    CLASS_SYMBOL,
+    CLASS_UPPER,
+    calculate_entropy,
+    character_class_mask,
+    estimate_crack_time,
+)
+from ..utils.matcher import scan_patterns
 from ..utils.patterns import (
-    has_common_pattern,
     has_sequential_chars,
     has_repeated_chars,
     is_keyboard_pattern,
 )
-from ..utils.wordlist import contains_dictionary_word
+
+# In-process LRU memo of the deterministic part of an analysis. It is
+# keyed by the password's SHA-256 digest (the password_hash every result
+# already carries), so no plaintext is retained; it can still be turned off
+# with SECUREPASS_NO_CACHE=1 (or use_cache=False).
+ANALYSIS_CACHE_SIZE = 4096
+_CACHE_DISABLED = os.environ.get("SECUREPASS_NO_CACHE", "") not in ("", "0")
+
+# (strength_score, strength_rating, entropy_bits, pool_size, criteria,
+#  crack_time, clean_recommendations)
+_Core = Tuple[int, str, float, int, Dict[str, bool], Dict[str, str], Tuple[str, ...]]
+_ANALYSIS_CACHE: "OrderedDict[str, _Core]" = OrderedDict()
+_ANALYSIS_LOCK = threading.Lock()
+
+# Entropy bonus thresholds (bits) and the bonus earned at/above each
+_ENTROPY_CUTS = (40, 50, 60, 70)
+_ENTROPY_BONUS = (0, 5, 10, 15, 20)
+
+# Score thresholds separating consecutive ratings
+_RATING_CUTS = (40, 70, 90)
+_RATINGS = ("weak", "moderate", "strong", "very_strong")
+
+# Breach status assumed by the precomputed recommendations
+_NOT_BREACHED: Dict[str, Any] = {"found": False}
+
+# Advice for each failed non-length criterion, in display order
+_CRITERIA_ADVICE = (
+    ("has_lowercase", "Add lowercase letters (a-z)"),
+    ("has_uppercase", "Add uppercase letters (A-Z)"),
+    ("has_digits", "Add numbers (0-9)"),
+    ("has_symbols", "Add symbols (!@#$%^&* etc.)"),
+    (
+        "no_common_patterns",
+        "⚠️ Contains common pattern (e.g., 'password', '123456'). Use unique password",
+    ),
+    ("no_dictionary_words", "⚠️ Contains dictionary word. Avoid common words"),
+    ("no_sequential_chars", "Avoid sequential characters (e.g., 'abc', '123')"),
+)
 
 
-def _check_criteria(password: str) -> Dict[str, bool]:
+def _check_criteria(password: str, mask: Optional[int] = None) -> Dict[str, bool]:
     """
     Check password against all security criteria.
 
@@ -42,32 +90,40 @@ def _check_criteria(password: str) -> Dict[str, bool]:
 
     Args:
         password: The password to evaluate
+        mask: Optional precomputed entropy.character_class_mask(password)
 
     Returns:
         Dictionary mapping criterion names to boolean pass/fail
     """
     criteria = {}
 
+    if mask is None:
+        mask = character_class_mask(password)
+
     # Criterion 1: Minimum length (12+ for strong)
     criteria["min_length"] = len(password) >= 12
 
     # Criterion 2: Contains lowercase
-    criteria["has_lowercase"] = any(c in string.ascii_lowercase for c in password)
+    criteria["has_lowercase"] = bool(mask & CLASS_LOWER)
 
     # Criterion 3: Contains uppercase
-    criteria["has_uppercase"] = any(c in string.ascii_uppercase for c in password)
+    criteria["has_uppercase"] = bool(mask & CLASS_UPPER)
 
     # Criterion 4: Contains digits
-    criteria["has_digits"] = any(c in string.digits for c in password)
+    criteria["has_digits"] = bool(mask & CLASS_DIGIT)
 
     # Criterion 5: Contains symbols
-    criteria["has_symbols"] = any(c in string.punctuation for c in password)
+    criteria["has_symbols"] = bool(mask & CLASS_SYMBOL)
+
+    # Criteria 6 and 7 share one scan of the lowercased password
+    password_lower = password.lower()
+    has_common, has_dictionary = scan_patterns(password, password_lower)
 
     # Criterion 6: No common patterns
-    criteria["no_common_patterns"] = not has_common_pattern(password)
+    criteria["no_common_patterns"] = not has_common
 
     # Criterion 7: Not a dictionary word
-    criteria["no_dictionary_words"] = not contains_dictionary_word(password)
+    criteria["no_dictionary_words"] = not has_dictionary
 
     # Criterion 8: No sequential characters
     criteria["no_sequential_chars"] = not has_sequential_chars(password)
@@ -95,19 +151,10 @@ def calculate_strength_score(criteria: Dict[str, bool], entropy: float) -> int:
         Integer score from 0 to 100
     """
     # Base score: 10 points per criterion (max 80)
-    base_score = sum(10 for passed in criteria.values() if passed)
+    base_score = 10 * sum(map(bool, criteria.values()))
 
     # Entropy bonus (max 20 points)
-    if entropy >= 70:
-        entropy_bonus = 20
-    elif entropy >= 60:
-        entropy_bonus = 15
-    elif entropy >= 50:
-        entropy_bonus = 10
-    elif entropy >= 40:
-        entropy_bonus = 5
-    else:
-        entropy_bonus = 0
+    entropy_bonus = _ENTROPY_BONUS[bisect.bisect_right(_ENTROPY_CUTS, entropy)]
 
     total_score = base_score + entropy_bonus
 
@@ -131,14 +178,7 @@ def _determine_rating(score: int) -> str:
     Returns:
         Rating string: 'weak', 'moderate', 'strong', or 'very_strong'
     """
-    if score < 40:
-        return "weak"
-    elif score < 70:
-        return "moderate"
-    elif score < 90:
-        return "strong"
-    else:
-        return "very_strong"
+    return _RATINGS[bisect.bisect_right(_RATING_CUTS, score)]
 
 
 def get_recommendations(analysis: PasswordAnalysis) -> List[str]:
@@ -151,58 +191,66 @@ def get_recommendations(analysis: PasswordAnalysis) -> List[str]:
     Args:
         analysis: PasswordAnalysis object with criteria results
 
+    Returns:
+        List of recommendation strings
+    """
+    return _build_recommendations(
+        analysis.criteria_met,
+        analysis.length,
+        analysis.entropy_bits,
+        analysis.breach_status,
+    )
+
+
+def _build_recommendations(
+    criteria: Dict[str, bool],
+    length: int,
+    entropy_bits: float,
+    breach_status: Dict[str, Any],
+) -> List[str]:
+    """
+    Build recommendations from raw analysis fields.
+
+    Lets analyze_password() produce recommendations before the
+    PasswordAnalysis object exists (see get_recommendations).
+
+    Args:
+        criteria: Criteria pass/fail results
+        length: Password length
+        entropy_bits: Password entropy in bits
+        breach_status: Breach check results
+
     Returns:
         List of recommendation strings
     """
     recommendations = []
-    criteria = analysis.criteria_met
 
     # Length recommendations
     if not criteria.get("min_length", False):
-        if analysis.length < 8:
+        if length < 8:
             recommendations.append(
                 "⚠️ CRITICAL: Password is too short. Use at least 8 characters (12+ recommended)"
             )
-        elif analysis.length < 12:
+        elif length < 12:
             recommendations.append(
                 "Increase length to at least 12 characters for better security"
             )
 
-    # Character diversity recommendations
-    if not criteria.get("has_lowercase", False):
-        recommendations.append("Add lowercase letters (a-z)")
-
-    if not criteria.get("has_uppercase", False):
-        recommendations.append("Add uppercase letters (A-Z)")
-
-    if not criteria.get("has_digits", False):
-        recommendations.append("Add numbers (0-9)")
-
-    if not criteria.get("has_symbols", False):
-        recommendations.append("Add symbols (!@#$%^&* etc.)")
-
-    # Pattern and dictionary recommendations
-    if not criteria.get("no_common_patterns", False):
-        recommendations.append(
-            "⚠️ Contains common pattern (e.g., 'password', '123456'). Use unique password"
-        )
-
-    if not criteria.get("no_dictionary_words", False):
-        recommendations.append("⚠️ Contains dictionary word. Avoid common words")
-
-    if not criteria.get("no_sequential_chars", False):
-        recommendations.append("Avoid sequential characters (e.g., 'abc', '123')")
+    # Character diversity, pattern and dictionary recommendations
+    recommendations.extend(
+        advice for key, advice in _CRITERIA_ADVICE if not criteria.get(key, False)
+    )
 
     # Breach recommendations
-    if analysis.breach_status.get("found", False):
-        count = analysis.breach_status.get("occurrence_count", 0)
+    if breach_status.get("found", False):
+        count = breach_status.get("occurrence_count", 0)
         recommendations.append(
             f"🚨 CRITICAL: Password found in {count:,} data breaches! "
             f"Change this password immediately!"
         )
 
     # Entropy-based recommendations
-    if analysis.entropy_bits < 40:
+    if entropy_bits < 40:
         recommendations.append(
             "Password entropy is low. Make it longer and more random"
         )
@@ -214,8 +262,89 @@ def get_recommendations(analysis: PasswordAnalysis) -> List[str]:
     return recommendations
 
 
+def _analyze_core(password: str) -> _Core:
+    """
+    Compute every analysis field that depends only on the password.
+
+    Recommendations are partially evaluated for the common case of a
+    password not found in breaches; analyze_password() only rebuilds
+    them when a breach is reported.
+
+    Args:
+        password: The password to analyze
+
+    Returns:
+        Tuple of (strength_score, strength_rating, entropy_bits,
+        pool_size, criteria, crack_time, recommendations). The dicts are
+        shared between cache hits; callers must copy before handing out.
+    """
+    # Classify characters once; shared by entropy and criteria checks
+    mask = character_class_mask(password)
+
+    # Calculate entropy
+    entropy_bits, pool_size = calculate_entropy(password, mask)
+
+    # Check all criteria
+    criteria = _check_criteria(password, mask)
+
+    # Calculate strength score
+    strength_score = calculate_strength_score(criteria, entropy_bits)
+
+    # Determine rating
+    strength_rating = _determine_rating(strength_score)
+
+    # Estimate crack time
+    crack_time = estimate_crack_time(entropy_bits)
+
+    # Recommendations assuming no breach was found
+    recommendations = tuple(
+        _build_recommendations(criteria, len(password), entropy_bits, _NOT_BREACHED)
+    )
+
+    return (
+        strength_score,
+        strength_rating,
+        entropy_bits,
+        pool_size,
+        criteria,
+        crack_time,
+        recommendations,
+    )
+
+
+def _cached_core(password: str, password_hash: str) -> _Core:
+    """Return _analyze_core(password), memoized under its SHA-256 digest."""
+    with _ANALYSIS_LOCK:
+        core = _ANALYSIS_CACHE.get(password_hash)
+        if core is not None:
+            _ANALYSIS_CACHE.move_to_end(password_hash)
+            return core
+
+    core = _analyze_core(password)
+    with _ANALYSIS_LOCK:
+        _ANALYSIS_CACHE[password_hash] = core
+        if len(_ANALYSIS_CACHE) > ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
+    return core
+
+
+def clear_analysis_cache() -> None:
+    """Forget all memoized analyses."""
+    with _ANALYSIS_LOCK:
+        _ANALYSIS_CACHE.clear()
+
+
+# Drop cached digests on shutdown
+atexit.register(clear_analysis_cache)
+
+
 def analyze_password(
-    password: str, check_breach_status: bool = True
+    password: str,
+    check_breach_status: bool = True,
+    breach_cache: Optional[Dict[str, Dict[str, int]]] = None,
+    sha1_hex: Optional[str] = None,
+    http_session: Any = None,
+    use_cache: bool = True,
 ) -> PasswordAnalysis:
     """
     Perform comprehensive password analysis.
@@ -230,6 +359,15 @@ def analyze_password(
     Args:
         password: The password to analyze
         check_breach_status: Whether to check HIBP API (default: True)
+        breach_cache: Optional prefetched HIBP ranges (see
+                      breach.fetch_breach_ranges) used instead of the API
+        sha1_hex: Optional precomputed SHA-1 hex digest of the password,
+                  forwarded to check_breach
+        http_session: Optional requests.Session (see breach.create_session)
+                      reused for HIBP requests
+        use_cache: Serve the deterministic fields from the in-process LRU
+                   cache (default: True; ignored if SECUREPASS_NO_CACHE
+                   is set)
 
     Returns:
         Complete PasswordAnalysis object with all metrics
@@ -247,28 +385,40 @@ def analyze_password(
         >>> result.strength_score > 90
         True
     """
-    # Generate SHA-256 hash for audit trail (NOT for breach checking)
-    password_hash = hashlib.sha256(password.encode("utf-8")).hexdigest()
-
     # Get current timestamp
     timestamp = datetime.now().isoformat()
 
-    # Calculate entropy
-    entropy_bits, pool_size = calculate_entropy(password)
-
-    # Check all criteria
-    criteria = _check_criteria(password)
-
-    # Calculate strength score
-    strength_score = calculate_strength_score(criteria, entropy_bits)
-
-    # Determine rating
-    strength_rating = _determine_rating(strength_score)
+    # Generate SHA-256 hash for audit trail (NOT for breach checking);
+    # it doubles as the analysis cache key
+    password_hash = hashlib.sha256(password.encode("utf-8")).hexdigest()
 
-    # Check breach status (if enabled)
+    # Entropy, criteria, score, rating and crack time
+    if use_cache and not _CACHE_DISABLED:
+        core = _cached_core(password, password_hash)
+    else:
+        core = _analyze_core(password)
+    (
+        strength_score,
+        strength_rating,
+        entropy_bits,
+        pool_size,
+        criteria,
+        crack_time,
+        clean_recommendations,
+    ) = core
+
+    # Check breach status (if enabled); breach pulls in requests, so it is
+    # imported only when a check is actually made
     if check_breach_status:
+        from .breach import check_breach
+
         try:
-            is_breached, breach_count = check_breach(password)
+            is_breached, breach_count = check_breach(
+                password,
+                breach_cache=breach_cache,
+                sha1_hex=sha1_hex,
+                session=http_session,
+            )
             breach_status = {
                 "checked": True,
                 "found": is_breached,
@@ -280,11 +430,16 @@ def analyze_password(
     else:
         breach_status = {"checked": False, "found": False, "occurrence_count": 0}
 
-    # Estimate crack time
-    crack_time = estimate_crack_time(entropy_bits)
+    # Generate recommendations, then build the finished analysis object
+    criteria = dict(criteria)
+    if breach_status["found"]:
+        recommendations = _build_recommendations(
+            criteria, len(password), entropy_bits, breach_status
+        )
+    else:
+        recommendations = list(clean_recommendations)
 
-    # Create analysis object (without recommendations initially)
-    analysis = PasswordAnalysis(
+    return PasswordAnalysis(
         password_hash=password_hash,
         timestamp=timestamp,
         strength_score=strength_score,
@@ -294,11 +449,51 @@ def analyze_password(
         character_pool_size=pool_size,
         criteria_met=criteria,
         breach_status=breach_status,
-        recommendations=[],  # Will be filled next
-        estimated_crack_time=crack_time,
+        recommendations=recommendations,
+        estimated_crack_time=dict(crack_time),
     )
 
-    # Generate recommendations based on analysis
-    analysis.recommendations = get_recommendations(analysis)
 
-    return analysis
+def analyze_passwords(
+    passwords: Iterable[str],
+    check_breach_status: bool = True,
+    http_session: Any = None,
+) -> List[PasswordAnalysis]:
+    """
+    Analyze many passwords, sharing work between them.
+
+    Breach data for every distinct hash prefix is fetched once up front
+    (concurrently, see breach.fetch_breach_ranges), and repeated passwords
+    are served from the analysis cache.
+
+    Args:
+        passwords: Passwords to analyze
+        check_breach_status: Whether to check HIBP API (default: True)
+        http_session: Optional requests.Session reused for HIBP requests
+
+    Returns:
+        List of PasswordAnalysis objects in input order
+    """
+    passwords = list(passwords)
+    breach_cache = None
+    sha1_hashes: Dict[str, str] = {}
+
+    if check_breach_status:
+        from .breach import _sha1_hash, fetch_breach_ranges
+
+        sha1_hashes = {password: _sha1_hash(password) for password in passwords}
+        breach_cache = fetch_breach_ranges(
+            [sha1 for password, sha1 in sha1_hashes.items() if password],
+            session=http_session,
+        )
+
+    return [
+        analyze_password(
+            password,
+            check_breach_status=check_breach_status,
+            breach_cache=breach_cache,
+            sha1_hex=sha1_hashes.get(password),
+            http_session=http_session,
+        )
+        for password in passwords
+    ]
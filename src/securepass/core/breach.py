@@ -6,10 +6,97 @@ using k-anonymity to protect password privacy.
 """
 
 import hashlib
+import os
+import sys
+import threading
 import time
-from typing import Any, Tuple, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple, List
 
 import requests  # type: ignore[import-untyped]
+from urllib3.util.retry import Retry
+
+from ..utils.bloom import BloomFilter
+
+# In-process cache of HIBP range responses, keyed by 5-char hash prefix.
+# Bounded LRU: a padded response holds ~800 suffixes (~150 KB as a dict).
+BREACH_CACHE_PREFIXES = 1024
+_PREFIX_CACHE: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+# Occurrence counts of full hashes known to be breached; these survive
+# range eviction since once pwned, always pwned
+_BREACH_HITS: Dict[str, int] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_get(hash_prefix: str) -> Optional[Dict[str, int]]:
+    """Return the cached range for a prefix, marking it recently used."""
+    with _CACHE_LOCK:
+        suffixes = _PREFIX_CACHE.get(hash_prefix)
+        if suffixes is not None:
+            _PREFIX_CACHE.move_to_end(hash_prefix)
+        return suffixes
+
+
+def _cache_put(hash_prefix: str, suffixes: Dict[str, int]) -> None:
+    """Store a range response, evicting the least recently used prefix."""
+    with _CACHE_LOCK:
+        _PREFIX_CACHE[hash_prefix] = suffixes
+        _PREFIX_CACHE.move_to_end(hash_prefix)
+        if len(_PREFIX_CACHE) > BREACH_CACHE_PREFIXES:
+            _PREFIX_CACHE.popitem(last=False)
+
+
+# Shared keep-alive session for calls that don't supply their own; sized
+# for fetch_breach_ranges' default concurrency
+_SESSION: Any = None
+_SESSION_POOL_SIZE = 32
+_SESSION_LOCK = threading.Lock()
+
+
+# Optional Bloom filter of breached hashes, consulted before the API.
+# Loaded lazily from $SECUREPASS_HIBP_BLOOM (see utils.bloom) or set with
+# set_breach_filter(); False means "not loaded yet".
+_BLOOM: Any = False
+
+
+def set_breach_filter(bloom: Optional[BloomFilter]) -> None:
+    """
+    Install (or with None, disable) the breach Bloom filter.
+
+    Hashes the filter reports as absent are treated as not breached
+    without contacting the API, so the filter must be built from the
+    breach corpus you want to check against.
+
+    Args:
+        bloom: Filter of uppercase SHA-1 digests, or None
+    """
+    global _BLOOM
+    _BLOOM = bloom
+
+
+def _breach_filter() -> Optional[BloomFilter]:
+    """Return the breach Bloom filter, loading it on first use."""
+    global _BLOOM
+    if _BLOOM is False:
+        path = os.environ.get("SECUREPASS_HIBP_BLOOM")
+        _BLOOM = BloomFilter.load(path) if path else None
+    return _BLOOM
+
+
+def clear_breach_cache() -> None:
+    """Forget all cached HIBP responses and known breached hashes."""
+    with _CACHE_LOCK:
+        _PREFIX_CACHE.clear()
+        _BREACH_HITS.clear()
+
+
+# SHA-1 is only used for the HIBP k-anonymity lookup, so mark it as not
+# security-relevant (keeps it available under FIPS-restricted OpenSSL).
+# The flag needs Python 3.9+.
+_SHA1_KWARGS: Dict[str, bool] = (
+    {"usedforsecurity": False} if sys.version_info >= (3, 9) else {}
+)
 
 
 def _sha1_hash(password: str) -> str:
@@ -26,14 +113,89 @@ def _sha1_hash(password: str) -> str:
         >>> _sha1_hash("password")
         '5BAA61E4C9B93F3F0682250B6CF8331B7EE68FD8'
     """
-    return (
-        hashlib.sha1(password.encode("utf-8"), usedforsecurity=False)
-        .hexdigest()
-        .upper()
+    return hashlib.sha1(password.encode("utf-8"), **_SHA1_KWARGS).hexdigest().upper()
+
+
+# Connection-level retries for pooled sessions. raise_on_status=False hands
+# the last error response back so raise_for_status() reports it as usual.
+# Retry-After from a 429 is honoured.
+_ADAPTER_RETRY = Retry(
+    total=2,
+    backoff_factor=0.2,
+    status_forcelist=(429, 502, 503, 504),
+    raise_on_status=False,
+)
+
+
+def create_session(pool_size: int = 10) -> Any:
+    """
+    Create a requests.Session for repeated HIBP lookups.
+
+    Reusing one session keeps HTTPS connections alive between requests,
+    so bulk checks pay the TCP/TLS handshake once per pooled connection
+    instead of once per lookup. Dropped connections and rate-limit or
+    gateway errors are retried briefly on the pooled connection, before
+    check_breach() falls back to its own slower retries.
+
+    Args:
+        pool_size: Maximum pooled connections, typically the number of
+                   threads issuing requests (default: 10)
+
+    Returns:
+        Configured requests.Session
+    """
+    if requests is None:
+        raise ImportError("requests library is required for breach checking")
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=_ADAPTER_RETRY,
     )
+    session.mount("https://", adapter)
+    return session
+
+
+def _default_session() -> Any:
+    """Return the module-wide requests.Session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = create_session(pool_size=_SESSION_POOL_SIZE)
+    return _SESSION
+
+
+def _parse_range(text: str) -> Dict[str, int]:
+    """
+    Parse an HIBP range response body (format: SUFFIX:COUNT per line).
+
+    Splits the whole body in C (every ':' becomes a line break, so fields
+    alternate suffix/count) instead of splitting line by line; bodies
+    with stray lines fall back to the per-line loop.
+
+    Args:
+        text: Response body
+
+    Returns:
+        Dictionary mapping hash suffix to occurrence count
+    """
+    fields = text.replace(":", "\n").splitlines()
+    if len(fields) == 2 * text.count(":"):
+        return dict(zip(fields[::2], map(int, fields[1::2])))
+
+    suffixes = {}
+    for line in text.splitlines():
+        if ":" in line:
+            suffix, count = line.split(":", 1)
+            suffixes[suffix] = int(count)
+    return suffixes
 
 
-def _api_request(hash_prefix: str, timeout: int = 10) -> List[Tuple[str, int]]:
+def _api_request(
+    hash_prefix: str, timeout: int = 10, session: Any = None
+) -> Dict[str, int]:
     """
     Make request to Have I Been Pwned API.
 
@@ -42,9 +204,12 @@ def _api_request(hash_prefix: str, timeout: int = 10) -> List[Tuple[str, int]]:
     Args:
         hash_prefix: First 5 characters of SHA-1 hash
         timeout: Request timeout in seconds
+        session: Optional requests.Session (see create_session); the shared
+                 module session is used otherwise, so connections are
+                 kept alive between calls
 
     Returns:
-        List of hash suffixes from API response
+        Dictionary mapping hash suffix to occurrence count
 
     Raises:
         requests.RequestException: On network errors
@@ -60,17 +225,11 @@ def _api_request(hash_prefix: str, timeout: int = 10) -> List[Tuple[str, int]]:
     }
 
     try:
-        response = requests.get(api_url, headers=headers, timeout=timeout)
+        http = session if session is not None else _default_session()
+        response = http.get(api_url, headers=headers, timeout=timeout)
         response.raise_for_status()
 
-        # Parse response (format: SUFFIX:COUNT\n)
-        suffixes = []
-        for line in response.text.splitlines():
-            if ":" in line:
-                suffix, count = line.split(":", 1)
-                suffixes.append((suffix, int(count)))
-
-        return suffixes
+        return _parse_range(response.text)
 
     except requests.Timeout:
         raise requests.RequestException(
@@ -84,8 +243,113 @@ def _api_request(hash_prefix: str, timeout: int = 10) -> List[Tuple[str, int]]:
         raise requests.RequestException(f"HTTP error occurred: {e}")
 
 
+def fetch_breach_ranges(
+    sha1_hashes: Iterable[str],
+    timeout: int = 10,
+    max_workers: int = 32,
+    session: Any = None,
+) -> Dict[str, Dict[str, int]]:
+    """
+    Prefetch HIBP range responses for a collection of password hashes.
+
+    Each distinct 5-character SHA-1 prefix is requested only once, with
+    requests issued concurrently; prefixes already in the in-process
+    cache are not requested again. The result can be passed to
+    check_breach() as ``breach_cache`` so individual checks are answered
+    locally.
+
+    Args:
+        sha1_hashes: Uppercase SHA-1 hex digests (from _sha1_hash) of the
+                     passwords to prefetch breach data for
+        timeout: Request timeout in seconds (default: 10)
+        max_workers: Maximum concurrent API requests (default: 32)
+        session: Optional requests.Session shared by all requests
+
+    Returns:
+        Dictionary mapping hash prefix to {hash_suffix: occurrence_count}.
+        Prefixes whose request failed are omitted, so check_breach() falls
+        back to its normal retrying lookup for them.
+    """
+    bloom = _breach_filter()
+    if bloom is not None:
+        # Hashes the filter rules out are answered by check_breach()
+        sha1_hashes = [sha1 for sha1 in sha1_hashes if sha1 in bloom]
+    prefixes = {sha1[:5] for sha1 in sha1_hashes}
+
+    ranges: Dict[str, Dict[str, int]] = {}
+    for prefix in list(prefixes):
+        cached = _cache_get(prefix)
+        if cached is not None:
+            ranges[prefix] = cached
+            prefixes.discard(prefix)
+
+    def _fetch(prefix: str) -> Tuple[str, Optional[Dict[str, int]]]:
+        try:
+            return prefix, _api_request(prefix, timeout, session=session)
+        except Exception:
+            return prefix, None
+
+    if not prefixes:
+        return ranges
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(prefixes))) as executor:
+        for prefix, suffixes in executor.map(_fetch, prefixes):
+            if suffixes is not None:
+                ranges[prefix] = suffixes
+                _cache_put(prefix, suffixes)
+
+    return ranges
+
+
+def check_breach_many(
+    passwords: Iterable[str],
+    max_workers: int = 16,
+    timeout: int = 10,
+    session: Any = None,
+) -> List[Tuple[bool, int]]:
+    """
+    Check several passwords against Have I Been Pwned at once.
+
+    Distinct hash prefixes across all passwords are fetched concurrently
+    (see fetch_breach_ranges), so duplicates and passwords sharing a
+    prefix cost a single request.
+
+    Args:
+        passwords: Passwords to check
+        max_workers: Maximum concurrent API requests (default: 16)
+        timeout: Request timeout in seconds (default: 10)
+        session: Optional requests.Session shared by all requests
+
+    Returns:
+        List of (is_breached, occurrence_count) tuples in input order
+    """
+    passwords = list(passwords)
+    hashes = [_sha1_hash(password) for password in passwords]
+    ranges = fetch_breach_ranges(
+        [sha1 for password, sha1 in zip(passwords, hashes) if password],
+        timeout=timeout,
+        max_workers=max_workers,
+        session=session,
+    )
+    return [
+        check_breach(
+            password,
+            timeout=timeout,
+            breach_cache=ranges,
+            sha1_hex=sha1,
+            session=session,
+        )
+        for password, sha1 in zip(passwords, hashes)
+    ]
+
+
 def check_breach(
-    password: str, timeout: int = 10, max_retries: int = 3
+    password: str,
+    timeout: int = 10,
+    max_retries: int = 3,
+    breach_cache: Optional[Dict[str, Dict[str, int]]] = None,
+    sha1_hex: Optional[str] = None,
+    session: Any = None,
 ) -> Tuple[bool, int]:
     """
     Check if password exists in Have I Been Pwned database.
@@ -96,12 +360,19 @@ def check_breach(
     3. Receives list of matching hash suffixes
     4. Checks locally if full hash matches
 
-    This ensures the actual password is never sent to the API.
+    This ensures the actual password is never sent to the API. Range
+    responses are cached in-process by prefix (see clear_breach_cache),
+    so later checks sharing a prefix are answered without a request.
 
     Args:
         password: The password to check
         timeout: Request timeout in seconds (default: 10)
         max_retries: Maximum number of retry attempts (default: 3)
+        breach_cache: Optional prefetched ranges from fetch_breach_ranges();
+                      prefixes found here skip the network request
+        sha1_hex: Optional precomputed _sha1_hash(password), so batch
+                  callers that already hashed the password don't repeat it
+        session: Optional requests.Session to reuse pooled connections
 
     Returns:
         Tuple of (is_breached, occurrence_count)
@@ -122,19 +393,40 @@ def check_breach(
         return (False, 0)
 
     # Step 1: Hash the password
-    full_hash = _sha1_hash(password)
+    full_hash = sha1_hex if sha1_hex is not None else _sha1_hash(password)
     hash_prefix = full_hash[:5]
     hash_suffix = full_hash[5:]
 
+    # Answer locally if this prefix was already fetched
+    cached = None
+    if breach_cache is not None:
+        cached = breach_cache.get(hash_prefix)
+    if cached is None:
+        cached = _cache_get(hash_prefix)
+    if cached is not None:
+        count = cached.get(hash_suffix, 0)
+        return (count > 0, count)
+    if full_hash in _BREACH_HITS:
+        # Range was evicted, but a breach never un-happens
+        return (True, _BREACH_HITS[full_hash])
+
+    # Definitely absent from the breach filter: skip the API
+    bloom = _breach_filter()
+    if bloom is not None and full_hash not in bloom:
+        return (False, 0)
+
     # Step 2: Make API request with retry logic
     for attempt in range(max_retries):
         try:
-            suffixes = _api_request(hash_prefix, timeout)
+            suffixes = _api_request(hash_prefix, timeout, session=session)
+            _cache_put(hash_prefix, suffixes)
 
             # Step 3: Check if our hash suffix matches any returned suffix
-            for returned_suffix, count in suffixes:
-                if returned_suffix == hash_suffix:
-                    return (True, count)
+            count = suffixes.get(hash_suffix, 0)
+            if count > 0:
+                with _CACHE_LOCK:
+                    _BREACH_HITS[full_hash] = count
+                return (True, count)
 
             # Not found in breach database
             return (False, 0)
@@ -5,12 +5,67 @@ Calculates Shannon entropy for passwords and estimates crack time
 under various attack scenarios.
 """
 
+import bisect
 import math
-from typing import Tuple, Dict
+from typing import Optional, Tuple, Dict
 import string
 
+# Character class bits returned by character_class_mask()
+CLASS_LOWER = 1
+CLASS_UPPER = 2
+CLASS_DIGIT = 4
+CLASS_SYMBOL = 8
+_ALL_CLASSES = CLASS_LOWER | CLASS_UPPER | CLASS_DIGIT | CLASS_SYMBOL
 
-def get_character_pool_size(password: str) -> int:
+
+# Character sets as frozensets so membership tests run in C
+_LOWER_SET = frozenset(string.ascii_lowercase)
+_UPPER_SET = frozenset(string.ascii_uppercase)
+_DIGIT_SET = frozenset(string.digits)
+_SYMBOL_SET = frozenset(string.punctuation)
+
+
+# Pool size and its log2 for each of the 16 possible class masks
+_POOL_BY_MASK = tuple(
+    (26 if mask & CLASS_LOWER else 0)
+    + (26 if mask & CLASS_UPPER else 0)
+    + (10 if mask & CLASS_DIGIT else 0)
+    + (32 if mask & CLASS_SYMBOL else 0)
+    for mask in range(_ALL_CLASSES + 1)
+)
+_LOG2_BY_MASK = tuple(math.log2(pool) if pool else 0.0 for pool in _POOL_BY_MASK)
+
+
+def character_class_mask(password: str) -> int:
+    """
+    Find which character classes occur in a password.
+
+    Each of the four classes is tested with frozenset.isdisjoint(), which
+    scans the string at C level and stops at the first member of the
+    class, so the password is walked up to four times rather than once in
+    a Python loop. Non-ASCII characters belong to no class.
+
+    Args:
+        password: The password to classify
+
+    Returns:
+        Bitmask of CLASS_LOWER, CLASS_UPPER, CLASS_DIGIT and CLASS_SYMBOL
+
+    Examples:
+        >>> character_class_mask("Password123!") == _ALL_CLASSES
+        True
+        >>> character_class_mask("password") == CLASS_LOWER
+        True
+    """
+    return (
+        (0 if _LOWER_SET.isdisjoint(password) else CLASS_LOWER)
+        | (0 if _UPPER_SET.isdisjoint(password) else CLASS_UPPER)
+        | (0 if _DIGIT_SET.isdisjoint(password) else CLASS_DIGIT)
+        | (0 if _SYMBOL_SET.isdisjoint(password) else CLASS_SYMBOL)
+    )
+
+
+def get_character_pool_size(password: str, mask: Optional[int] = None) -> int:
     """
     Detect the character pool size used in a password.
 
@@ -22,6 +77,7 @@ def get_character_pool_size(password: str) -> int:
 
     Args:
         password: The password to analyze
+        mask: Optional precomputed character_class_mask(password)
 
     Returns:
         Total size of the character pool (sum of active character sets)
@@ -35,28 +91,13 @@ def get_character_pool_size(password: str) -> int:
     if not password:
         return 0
 
-    pool_size = 0
-
-    # Check for lowercase letters
-    if any(c in string.ascii_lowercase for c in password):
-        pool_size += 26
-
-    # Check for uppercase letters
-    if any(c in string.ascii_uppercase for c in password):
-        pool_size += 26
+    if mask is None:
+        mask = character_class_mask(password)
 
-    # Check for digits
-    if any(c in string.digits for c in password):
-        pool_size += 10
+    return _POOL_BY_MASK[mask]
 
-    # Check for symbols (punctuation and special characters)
-    if any(c in string.punctuation for c in password):
-        pool_size += 32
 
-    return pool_size
-
-
-def calculate_entropy(password: str) -> Tuple[float, int]:
+def calculate_entropy(password: str, mask: Optional[int] = None) -> Tuple[float, int]:
     """
     Calculate Shannon entropy for a password.
 
@@ -67,6 +108,7 @@ def calculate_entropy(password: str) -> Tuple[float, int]:
 
     Args:
         password: The password to analyze
+        mask: Optional precomputed character_class_mask(password)
 
     Returns:
         Tuple of (entropy_bits, character_pool_size)
@@ -82,13 +124,16 @@ def calculate_entropy(password: str) -> Tuple[float, int]:
     if not password:
         return (0.0, 0)
 
-    pool_size = get_character_pool_size(password)
+    if mask is None:
+        mask = character_class_mask(password)
+
+    pool_size = _POOL_BY_MASK[mask]
 
     if pool_size == 0:
         return (0.0, 0)
 
-    # Shannon entropy formula
-    entropy_bits = math.log2(pool_size) * len(password)
+    # Shannon entropy formula, with log2(pool_size) precomputed per mask
+    entropy_bits = _LOG2_BY_MASK[mask] * len(password)
 
     return (entropy_bits, pool_size)
 
@@ -141,6 +186,34 @@ def estimate_crack_time(entropy_bits: float) -> Dict[str, str]:
     }
 
 
+# _format_time() bands: a duration below _TIME_CUTS[i] (and at or above
+# the previous cut) is shown in _TIME_UNITS[i - 1]; band 0 is "instant"
+_TIME_CUTS = (
+    0.001,
+    1,
+    60,
+    3600,
+    86400,
+    604800,
+    2592000,
+    31536000,
+    3153600000,  # 100 years
+    31536000000,  # 1000 years
+)
+_TIME_UNITS = (
+    (1, "{:.3f} seconds"),
+    (1, "{:.1f} seconds"),
+    (60, "{:.1f} minutes"),
+    (3600, "{:.1f} hours"),
+    (86400, "{:.1f} days"),
+    (604800, "{:.1f} weeks"),
+    (2592000, "{:.1f} months"),
+    (31536000, "{:.1f} years"),
+    (3153600000, "{:.1f} centuries"),
+    (31536000000, "{:.1f} millennia"),
+)
+
+
 def _format_time(seconds: float) -> str:
     """
     Format time duration into human-readable string.
@@ -151,33 +224,9 @@ def _format_time(seconds: float) -> str:
     Returns:
         Formatted string (e.g., "3.2 years", "5 centuries", "instant")
     """
-    if seconds < 0.001:
+    band = bisect.bisect_right(_TIME_CUTS, seconds)
+    if band == 0:
         return "instant"
-    elif seconds < 1:
-        return f"{seconds:.3f} seconds"
-    elif seconds < 60:
-        return f"{seconds:.1f} seconds"
-    elif seconds < 3600:
-        minutes = seconds / 60
-        return f"{minutes:.1f} minutes"
-    elif seconds < 86400:
-        hours = seconds / 3600
-        return f"{hours:.1f} hours"
-    elif seconds < 604800:
-        days = seconds / 86400
-        return f"{days:.1f} days"
-    elif seconds < 2592000:
-        weeks = seconds / 604800
-        return f"{weeks:.1f} weeks"
-    elif seconds < 31536000:
-        months = seconds / 2592000
-        return f"{months:.1f} months"
-    elif seconds < 3153600000:  # 100 years
-        years = seconds / 31536000
-        return f"{years:.1f} years"
-    elif seconds < 31536000000:  # 1000 years
-        centuries = seconds / 3153600000
-        return f"{centuries:.1f} centuries"
-    else:
-        millennia = seconds / 31536000000
-        return f"{millennia:.1f} millennia"
+
+    divisor, template = _TIME_UNITS[band - 1]
+    return template.format(seconds / divisor)
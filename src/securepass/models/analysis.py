@@ -4,13 +4,54 @@ Password Analysis Data Models
 Defines the data structures for password analysis results.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Union
-from datetime import datetime
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Dict, Iterable, List, TextIO, Union
+import csv
 import json
+import sys
 
+try:
+    import orjson  # Optional fast encoder (pip install securepass[fast])
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+
+class Rating(IntEnum):
+    """
+    Strength rating categories, ordered from weakest to strongest.
+
+    The integer value can be used to index fixed-size per-rating tallies;
+    the lowercase member name is the ``strength_rating`` string.
+    """
+
+    WEAK = 0
+    MODERATE = 1
+    STRONG = 2
+    VERY_STRONG = 3
+
+
+# strength_rating string -> Rating value
+_RATING_INDEX: Dict[str, int] = {rating.name.lower(): int(rating) for rating in Rating}
+
+# Criteria columns of to_csv_row()/csv_header(), in column order
+_CSV_CRITERIA = (
+    "min_length",
+    "has_lowercase",
+    "has_uppercase",
+    "has_digits",
+    "has_symbols",
+    "no_common_patterns",
+    "no_dictionary_words",
+    "no_sequential_chars",
+)
+
+
+# Slotted instances drop the per-object __dict__ (slots needs Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PasswordAnalysis:
     """
     Complete password analysis result.
@@ -35,6 +76,17 @@ class PasswordAnalysis:
     recommendations: List[str]  # Improvement suggestions
     estimated_crack_time: Dict[str, str]  # Crack time estimates
 
+    @property
+    def strength_rating_id(self) -> int:
+        """
+        Rating value of strength_rating, for indexing per-rating tallies.
+
+        Returns:
+            The Rating value, or -1 for a rating outside the Rating enum
+            (e.g. from imported records)
+        """
+        return _RATING_INDEX.get(self.strength_rating, -1)
+
     def to_dict(self) -> dict:
         """
         Convert analysis to dictionary for JSON export.
@@ -66,7 +118,11 @@ class PasswordAnalysis:
         Returns:
             JSON string representation
         """
-        return json.dumps(self.to_dict(), indent=indent)
+        if orjson is not None and indent == 2:
+            # orjson only supports 2-space indentation
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
+        # Like orjson, write non-ASCII characters as-is rather than escaped
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
 
     def to_csv_row(self) -> List[str]:
         """
@@ -75,6 +131,9 @@ class PasswordAnalysis:
         Returns:
             List of strings representing CSV row values
         """
+        criteria = self.criteria_met
+        breach_status = self.breach_status
+        crack_time = self.estimated_crack_time
         return [
             self.password_hash,
             self.timestamp,
@@ -83,20 +142,26 @@ class PasswordAnalysis:
             str(self.length),
             f"{self.entropy_bits:.2f}",
             str(self.character_pool_size),
-            str(self.criteria_met.get("min_length", False)),
-            str(self.criteria_met.get("has_lowercase", False)),
-            str(self.criteria_met.get("has_uppercase", False)),
-            str(self.criteria_met.get("has_digits", False)),
-            str(self.criteria_met.get("has_symbols", False)),
-            str(self.criteria_met.get("no_common_patterns", False)),
-            str(self.criteria_met.get("no_dictionary_words", False)),
-            str(self.criteria_met.get("no_sequential_chars", False)),
-            str(self.breach_status.get("found", False)),
-            str(self.breach_status.get("occurrence_count", 0)),
-            self.estimated_crack_time.get("online_attack_100_per_second", ""),
-            self.estimated_crack_time.get("offline_attack_10B_per_second", ""),
+            *[str(criteria.get(key, False)) for key in _CSV_CRITERIA],
+            str(breach_status.get("found", False)),
+            str(breach_status.get("occurrence_count", 0)),
+            crack_time.get("online_attack_100_per_second", ""),
+            crack_time.get("offline_attack_10B_per_second", ""),
         ]
 
+    @classmethod
+    def write_csv(cls, analyses: Iterable["PasswordAnalysis"], f: TextIO) -> None:
+        """
+        Write analyses as CSV, header first.
+
+        Args:
+            analyses: Analyses to write, one row each
+            f: Text file opened with newline=""
+        """
+        writer = csv.writer(f)
+        writer.writerow(cls.csv_header())
+        writer.writerows(analysis.to_csv_row() for analysis in analyses)
+
     @staticmethod
     def csv_header() -> List[str]:
         """
@@ -0,0 +1,180 @@
+"""
+Bloom Filter Module
+
+Compact, memory-mapped set of SHA-1 hashes used to skip Have I Been Pwned
+lookups for passwords that are definitely not in a known breach corpus.
+
+A filter answers "maybe present" or "definitely absent". It is only as
+complete as the hash list it was built from: a filter of the top N HIBP
+hashes will report rarer breached passwords as absent.
+
+Build one from the HIBP "pwned passwords" SHA-1 download with:
+
+    python -m securepass.utils.bloom pwned-passwords-sha1.txt hibp.bloom
+"""
+
+import math
+import mmap
+import struct
+import sys
+from typing import Iterable, List, Optional, Union
+
+# File layout: magic, version, bit count, hash count, then the bit array
+_MAGIC = b"SPBF"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIQI")
+
+
+def _indexes(sha1_hex: str, num_bits: int, num_hashes: int) -> List[int]:
+    """
+    Derive bit positions for a hash by double hashing.
+
+    SHA-1 output is already uniformly distributed, so two 64-bit slices
+    of it serve as the base hashes without rehashing.
+    """
+    h1 = int(sha1_hex[:16], 16)
+    h2 = int(sha1_hex[16:32], 16) | 1
+    return [(h1 + i * h2) % num_bits for i in range(num_hashes)]
+
+
+class BloomFilter:
+    """
+    Bloom filter over uppercase SHA-1 hex digests.
+
+    Args:
+        num_bits: Size of the bit array
+        num_hashes: Bit positions set per item
+        bits: Optional existing bit array (e.g. a memory map)
+    """
+
+    def __init__(
+        self,
+        num_bits: int,
+        num_hashes: int,
+        bits: Optional[Union[bytearray, memoryview]] = None,
+    ):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self._bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = 0.01) -> "BloomFilter":
+        """
+        Create an empty filter sized for capacity items.
+
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false positive rate (default: 1%)
+
+        Returns:
+            Empty BloomFilter
+        """
+        num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        num_hashes = max(1, round(num_bits / max(capacity, 1) * math.log(2)))
+        return cls(num_bits, num_hashes)
+
+    def add(self, sha1_hex: str) -> None:
+        """Add a SHA-1 hex digest to the filter."""
+        bits = self._bits
+        for index in _indexes(sha1_hex, self.num_bits, self.num_hashes):
+            bits[index >> 3] |= 1 << (index & 7)
+
+    def __contains__(self, sha1_hex: object) -> bool:
+        """Return False if the digest is definitely not in the filter."""
+        if not isinstance(sha1_hex, str):
+            return False
+        bits = self._bits
+        for index in _indexes(sha1_hex, self.num_bits, self.num_hashes):
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
+
+    def save(self, path: str) -> None:
+        """
+        Write the filter to a file.
+
+        Args:
+            path: Destination file path
+        """
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, self.num_bits, self.num_hashes))
+            f.write(self._bits)
+
+    @classmethod
+    def load(cls, path: str) -> "BloomFilter":
+        """
+        Memory-map a filter written by save().
+
+        Pages are read on demand, so a large filter costs little RAM and
+        no load time.
+
+        Args:
+            path: Filter file path
+
+        Returns:
+            Read-only BloomFilter
+
+        Raises:
+            ValueError: If the file is not a filter of this format
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(mapped) < _HEADER.size:
+            raise ValueError(f"Not a SecurePass Bloom filter: {path}")
+        magic, version, num_bits, num_hashes = _HEADER.unpack_from(mapped)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Not a SecurePass Bloom filter: {path}")
+        if len(mapped) - _HEADER.size < (num_bits + 7) // 8:
+            raise ValueError(f"Truncated Bloom filter: {path}")
+
+        bits = memoryview(mapped)[_HEADER.size :]
+        return cls(num_bits, num_hashes, bits=bits)
+
+
+def build_from_hashes(
+    lines: Iterable[str], capacity: int, error_rate: float = 0.01
+) -> BloomFilter:
+    """
+    Build a filter from HIBP-style lines ("SHA1HEX" or "SHA1HEX:COUNT").
+
+    Args:
+        lines: Lines of the hash list
+        capacity: Expected number of hashes
+        error_rate: Target false positive rate (default: 1%)
+
+    Returns:
+        Populated BloomFilter
+    """
+    bloom = BloomFilter.for_capacity(capacity, error_rate)
+    for line in lines:
+        sha1_hex = line.split(":", 1)[0].strip().upper()
+        if len(sha1_hex) == 40:
+            bloom.add(sha1_hex)
+    return bloom
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Build a filter file: bloom.py HASHES_TXT OUTPUT [ERROR_RATE]."""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) not in (2, 3):
+        print("usage: python -m securepass.utils.bloom HASHES_TXT OUTPUT [ERROR_RATE]")
+        return 2
+
+    source, output = args[0], args[1]
+    error_rate = float(args[2]) if len(args) == 3 else 0.01
+
+    with open(source, "r", encoding="ascii", errors="ignore") as f:
+        capacity = sum(1 for _ in f)
+    with open(source, "r", encoding="ascii", errors="ignore") as f:
+        bloom = build_from_hashes(f, capacity, error_rate)
+
+    bloom.save(output)
+    print(f"Wrote {bloom.num_bits // 8:,} byte filter for {capacity:,} hashes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
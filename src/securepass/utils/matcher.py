@@ -0,0 +1,99 @@
+"""
+Combined Pattern Matcher Module
+
+Scans a password once for both common patterns and dictionary words,
+instead of running has_common_pattern() and contains_dictionary_word()
+as separate passes.
+"""
+
+import functools
+import re
+from typing import Dict, Optional, Pattern, Tuple
+
+from .patterns import COMMON_PATTERNS
+from .wordlist import load_wordlist, substring_words, trie_pattern
+
+# Flags recorded for each matchable word
+COMMON = 1
+DICTIONARY = 2
+_BOTH = COMMON | DICTIONARY
+
+
+@functools.lru_cache(maxsize=1)
+def _build_matcher() -> Tuple[Pattern[str], Dict[str, int], frozenset]:
+    """
+    Build (once) the combined regex and per-word flags.
+
+    The regex is a zero-width lookahead over a trie of every word (see
+    wordlist.trie_pattern), so finditer() reports the longest word starting at
+    each position. Any shorter listed word starting there is a prefix of
+    that match, so each word's flags include those of its listed prefixes.
+
+    Returns:
+        Tuple of (compiled regex, word -> flags, exact-match wordlist)
+    """
+    try:
+        wordlist = load_wordlist()
+        dictionary_words = substring_words()
+    except FileNotFoundError:
+        wordlist, dictionary_words = frozenset(), ()
+
+    flags: Dict[str, int] = {}
+    for pattern in COMMON_PATTERNS:
+        flags[pattern] = flags.get(pattern, 0) | COMMON
+    for word in dictionary_words:
+        flags[word] = flags.get(word, 0) | DICTIONARY
+
+    merged = {word: _or_prefix_flags(word, flags) for word in flags}
+    regex = re.compile("(?=(" + trie_pattern(flags) + "))")
+
+    return regex, merged, wordlist
+
+
+def _or_prefix_flags(word: str, flags: Dict[str, int]) -> int:
+    """OR together the flags of every listed word that prefixes word."""
+    result = 0
+    for end in range(1, len(word) + 1):
+        result |= flags.get(word[:end], 0)
+    return result
+
+
+def scan_patterns(
+    password: str, password_lower: Optional[str] = None
+) -> Tuple[bool, bool]:
+    """
+    Check for common patterns and dictionary words in one scan.
+
+    Equivalent to (has_common_pattern(password),
+    contains_dictionary_word(password)), but the lowercased password is
+    scanned once by a single compiled regex, stopping as soon as both
+    kinds of match have been seen.
+
+    Args:
+        password: The password to check
+        password_lower: Optional precomputed password.lower()
+
+    Returns:
+        Tuple of (has_common_pattern, contains_dictionary_word)
+
+    Examples:
+        >>> scan_patterns("password123")
+        (True, True)
+        >>> scan_patterns("xK9#mQ2$pL")
+        (False, False)
+    """
+    if not password:
+        return (False, False)
+
+    regex, flags, wordlist = _build_matcher()
+
+    if password_lower is None:
+        password_lower = password.lower()
+    found = DICTIONARY if password_lower in wordlist else 0
+
+    for match in regex.finditer(password_lower):
+        found |= flags[match.group(1)]
+        if found == _BOTH:
+            break
+
+    return (bool(found & COMMON), bool(found & DICTIONARY))
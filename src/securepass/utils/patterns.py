@@ -8,7 +8,12 @@ Detects common weak password patterns including:
 - Keyboard patterns
 """
 
-from typing import List
+import operator
+import re
+from itertools import repeat
+from typing import Dict, List, Optional, Pattern
+
+from .wordlist import trie_pattern
 
 # Top 20 most common password patterns
 COMMON_PATTERNS: List[str] = [
@@ -47,8 +52,29 @@ KEYBOARD_PATTERNS: List[str] = [
     "zxcv",
 ]
 
+# has_sequential_chars() byte tables shifting each value by +1 and -1
+_STEP_UP = bytes((value + 1) % 256 for value in range(256))
+_STEP_DOWN = bytes((value - 1) % 256 for value in range(256))
+
+# has_sequential_chars() marks for ascending and descending steps
+# (non-ASCII passwords)
+_STEP_MARKS = {1: "+", -1: "-"}
+
+
+def _repeat_regex(min_repeats: int) -> Pattern[str]:
+    """Compile a regex matching any character repeated min_repeats times."""
+    return re.compile(r"(.)\1{%d}" % (min_repeats - 1), re.DOTALL)
+
 
-def has_common_pattern(password: str) -> bool:
+# Precompiled has_repeated_chars() regexes for the usual run lengths
+_REPEAT_RE: Dict[int, Pattern[str]] = {n: _repeat_regex(n) for n in (2, 3, 4, 5)}
+
+# One trie regex per list, each searched in a single C-level pass
+_COMMON_RE = re.compile(trie_pattern(COMMON_PATTERNS))
+_KEYBOARD_RE = re.compile(trie_pattern(KEYBOARD_PATTERNS))
+
+
+def has_common_pattern(password: str, password_lower: Optional[str] = None) -> bool:
     """
     Check if password contains a common weak pattern.
 
@@ -57,6 +83,7 @@ def has_common_pattern(password: str) -> bool:
 
     Args:
         password: The password to check
+        password_lower: Optional precomputed password.lower()
 
     Returns:
         True if password contains a common pattern, False otherwise
@@ -70,14 +97,11 @@ def has_common_pattern(password: str) -> bool:
     if not password:
         return False
 
-    password_lower = password.lower()
+    if password_lower is None:
+        password_lower = password.lower()
 
     # Check if password contains any common pattern
-    for pattern in COMMON_PATTERNS:
-        if pattern in password_lower:
-            return True
-
-    return False
+    return _COMMON_RE.search(password_lower) is not None
 
 
 def has_sequential_chars(password: str, min_length: int = 3) -> bool:
@@ -104,33 +128,35 @@ def has_sequential_chars(password: str, min_length: int = 3) -> bool:
     if not password or len(password) < min_length:
         return False
 
-    # Check for sequential characters
-    for i in range(len(password) - min_length + 1):
-        # Get a substring of min_length
-        substring = password[i : i + min_length]
-
-        # Check if all characters are sequential
-        is_sequential = True
-        for j in range(len(substring) - 1):
-            # Check if next character's ord value is exactly 1 more than current
-            if ord(substring[j + 1]) != ord(substring[j]) + 1:
-                is_sequential = False
-                break
-
-        if is_sequential:
-            return True
-
-        # Also check reverse sequential (e.g., "cba", "321")
-        is_reverse_sequential = True
-        for j in range(len(substring) - 1):
-            if ord(substring[j + 1]) != ord(substring[j]) - 1:
-                is_reverse_sequential = False
-                break
-
-        if is_reverse_sequential:
-            return True
+    if min_length <= 1:
+        # Any single character is a "sequence" of one
+        return True
+
+    run = min_length - 1
+
+    if password.isascii():
+        # Shift every byte up (then down) by one and XOR it against the
+        # following byte: a zero marks a +1 (or -1) step, so a sequence of
+        # min_length characters is a run of min_length - 1 zero bytes.
+        # One pass of C-level bytes/int operations per direction.
+        data = password.encode("ascii")
+        following = int.from_bytes(data[1:], "big")
+        size = len(data) - 1
+        zeros = bytes(run)
+        for table in (_STEP_UP, _STEP_DOWN):
+            shifted = int.from_bytes(data[:-1].translate(table), "big")
+            if zeros in (shifted ^ following).to_bytes(size, "big"):
+                return True
+        return False
 
-    return False
+    # Otherwise mark each step between neighbouring code points as +1
+    # ("+"), -1 ("-") or anything else ("."), and search for a run of
+    # min_length - 1 identical marks
+    codes = list(map(ord, password))
+    steps = "".join(
+        map(_STEP_MARKS.get, map(operator.sub, codes[1:], codes), repeat("."))
+    )
+    return "+" * run in steps or "-" * run in steps
 
 
 def has_repeated_chars(password: str, min_repeats: int = 3) -> bool:
@@ -157,24 +183,19 @@ def has_repeated_chars(password: str, min_repeats: int = 3) -> bool:
     if not password or len(password) < min_repeats:
         return False
 
-    # Check for repeated characters
-    for i in range(len(password) - min_repeats + 1):
-        # Get a character and check if it repeats min_repeats times
-        char = password[i]
-        is_repeated = True
-
-        for j in range(1, min_repeats):
-            if i + j >= len(password) or password[i + j] != char:
-                is_repeated = False
-                break
+    if min_repeats <= 1:
+        # Any single character is a "run" of one
+        return True
 
-        if is_repeated:
-            return True
+    # One C-level regex search for a character followed by itself
+    # min_repeats - 1 more times
+    regex = _REPEAT_RE.get(min_repeats)
+    if regex is None:
+        regex = _repeat_regex(min_repeats)
+    return regex.search(password) is not None
 
-    return False
 
-
-def is_keyboard_pattern(password: str) -> bool:
+def is_keyboard_pattern(password: str, password_lower: Optional[str] = None) -> bool:
     """
     Detect keyboard walk patterns.
 
@@ -184,6 +205,7 @@ def is_keyboard_pattern(password: str) -> bool:
 
     Args:
         password: The password to check
+        password_lower: Optional precomputed password.lower()
 
     Returns:
         True if keyboard pattern detected, False otherwise
@@ -197,11 +219,8 @@ def is_keyboard_pattern(password: str) -> bool:
     if not password:
         return False
 
-    password_lower = password.lower()
+    if password_lower is None:
+        password_lower = password.lower()
 
     # Check if password contains any keyboard pattern
-    for pattern in KEYBOARD_PATTERNS:
-        if pattern in password_lower:
-            return True
-
-    return False
+    return _KEYBOARD_RE.search(password_lower) is not None
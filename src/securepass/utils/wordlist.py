@@ -4,14 +4,38 @@ Wordlist Management Module
 Loads and checks passwords against a dictionary of common passwords.
 """
 
-from typing import Optional, Set
-import os
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+import functools
+import re
 
-# Module-level cache for wordlist (loaded once)
-_WORDLIST_CACHE: Optional[Set[str]] = None
 
+def _wordlist_path() -> Any:
+    """
+    Locate data/common_passwords.txt, which sits beside the package.
 
-def load_wordlist() -> Set[str]:
+    Returns:
+        Traversable (or Path on Python 3.8) for the wordlist file
+    """
+    try:
+        from importlib.resources import files
+    except ImportError:  # Python 3.8
+        from pathlib import Path
+
+        return Path(__file__).resolve().parents[2] / "data" / "common_passwords.txt"
+
+    # Go up from the securepass package to src, then to data
+    return files("securepass").joinpath("../data/common_passwords.txt")
+
+
+# Dictionary words shorter than this only count as exact matches
+_MIN_SUBSTRING_LENGTH = 4
+
+# Trie key marking the end of a word
+_END = ""
+
+
+@functools.lru_cache(maxsize=1)
+def load_wordlist() -> FrozenSet[str]:
     """
     Load common passwords from data file.
 
@@ -19,47 +43,98 @@ def load_wordlist() -> Set[str]:
     for fast O(1) lookup operations.
 
     Returns:
-        Set of common passwords (all lowercase)
+        Frozen set of common passwords (all lowercase)
 
     Raises:
         FileNotFoundError: If common_passwords.txt is not found
     """
-    global _WORDLIST_CACHE
-
-    # Return cached wordlist if already loaded
-    if _WORDLIST_CACHE is not None:
-        return _WORDLIST_CACHE
-
-    # Determine the path to the data file
-    # The data directory is at /home/claude/src/data/
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    # Go up from securepass/utils to src, then to data
-    data_path = os.path.join(
-        os.path.dirname(os.path.dirname(current_dir)), "data", "common_passwords.txt"
-    )
-
-    if not os.path.exists(data_path):
+    # Load wordlist: lowercase the whole file at once, strip each line
+    # and skip empty ones, all without a per-line Python loop
+    data_path = _wordlist_path()
+    try:
+        text = data_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Common passwords file not found at: {data_path}\n"
             "Please ensure data/common_passwords.txt exists."
-        )
+        ) from None
+    return frozenset(filter(None, map(str.strip, text.lower().splitlines())))
+
+
+@functools.lru_cache(maxsize=1)
+def substring_words() -> Tuple[str, ...]:
+    """
+    Get the wordlist entries that need checking as substrings.
 
-    # Load wordlist
-    wordlist = set()
-    with open(data_path, "r", encoding="utf-8") as f:
-        for line in f:
-            # Strip whitespace and convert to lowercase
-            word = line.strip().lower()
-            if word:  # Skip empty lines
-                wordlist.add(word)
+    Only words of 4+ characters are matched inside a password, and any
+    such word containing a shorter one (e.g. "password1" contains
+    "password") can never change the answer, so it is dropped. The full
+    wordlist is still used for exact matches.
 
-    # Cache the wordlist
-    _WORDLIST_CACHE = wordlist
+    Returns:
+        Minimal 4+ character words, shortest first (computed once)
 
-    return wordlist
+    Raises:
+        FileNotFoundError: If common_passwords.txt is not found
+    """
+    candidates = sorted(
+        (word for word in load_wordlist() if len(word) >= _MIN_SUBSTRING_LENGTH),
+        key=lambda word: (len(word), word),
+    )
+    kept: Set[str] = set()
+    words = []
+    for word in candidates:
+        # Shorter words are all decided by now; test every 4+ slice
+        size = len(word)
+        if not any(
+            word[start:end] in kept
+            for start in range(size - _MIN_SUBSTRING_LENGTH + 1)
+            for end in range(start + _MIN_SUBSTRING_LENGTH, size + 1)
+        ):
+            kept.add(word)
+            words.append(word)
+    return tuple(words)
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """
+    Build a regex matching any of words, factored as a character trie.
 
+    Shared prefixes are matched once ("pass(?:word(?:1)?|w0rd)") instead
+    of retrying every alternative, and greedy optional suffixes make the
+    longest word win at each position.
+
+    Args:
+        words: Non-empty words to match
 
-def contains_dictionary_word(password: str) -> bool:
+    Returns:
+        Regex source string
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_END] = {}
+
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [
+            re.escape(char) + emit(child)
+            for char, child in sorted(node.items())
+            if char != _END
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A word ends here, so anything longer is optional
+        return "(?:" + body + ")?" if _END in node else body
+
+    return emit(trie)
+
+
+def contains_dictionary_word(
+    password: str, password_lower: Optional[str] = None
+) -> bool:
     """
     Check if password is or contains a common dictionary word.
 
@@ -68,6 +143,7 @@ def contains_dictionary_word(password: str) -> bool:
 
     Args:
         password: The password to check
+        password_lower: Optional precomputed password.lower()
 
     Returns:
         True if password matches a dictionary word, False otherwise
@@ -82,26 +158,9 @@ def contains_dictionary_word(password: str) -> bool:
         >>> contains_dictionary_word("xK9#mQ2$pL")
         False
     """
-    if not password:
-        return False
-
-    try:
-        wordlist = load_wordlist()
-    except FileNotFoundError:
-        # If wordlist file is missing, can't check
-        # Return False to avoid blocking password analysis
-        return False
-
-    password_lower = password.lower()
-
-    # Check exact match
-    if password_lower in wordlist:
-        return True
-
-    # Check if password contains any word from the wordlist
-    # (e.g., "password123" contains "password")
-    for word in wordlist:
-        if len(word) >= 4 and word in password_lower:  # Only check words 4+ chars
-            return True
+    # Shares the combined common-pattern/dictionary scan (and its
+    # compiled trie) with the analyzer; imported here because the
+    # matcher itself builds on this module.
+    from .matcher import scan_patterns
 
-    return False
+    return scan_patterns(password, password_lower)[1]
@@ -49,6 +49,10 @@ setup(
         "requests>=2.31.0",
         "colorama>=0.4.6",
     ],
+    extras_require={
+        # Optional accelerator: JSON encoding for batch exports
+        "fast": ["orjson>=3.9.0"],
+    },
     entry_points={
         "console_scripts": [
             "securepass=securepass.__main__:main",
@@ -0,0 +1,21 @@
+"""
+Shared pytest fixtures.
+
+Generated passwords are produced once per test session and reused by
+every test that only inspects them.
+"""
+
+import pytest
+from securepass.core.generator import generate_password
+
+
+@pytest.fixture(scope="session")
+def default_passwords():
+    """100 passwords generated with the default settings."""
+    return [generate_password() for _ in range(100)]
+
+
+@pytest.fixture(scope="session")
+def long_password():
+    """One password of the maximum length (128)."""
+    return generate_password(length=128)
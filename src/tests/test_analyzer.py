@@ -12,8 +12,9 @@ from securepass.core.analyzer import (
     _determine_rating,
     get_recommendations,
     analyze_password,
+    analyze_passwords,
 )
-from securepass.models.analysis import PasswordAnalysis
+from securepass.models.analysis import PasswordAnalysis, Rating
 
 
 class TestCheckCriteria:
@@ -206,6 +207,78 @@ class TestAnalyzePassword:
         assert result.strength_rating == "very_strong"
         assert result.entropy_bits > 80
 
+    def test_rating_id_matches_rating(self):
+        """strength_rating_id should be the Rating value of strength_rating."""
+        weak = analyze_password("password", check_breach_status=False)
+        strong = analyze_password("K7$mP9@nQ2#wX5zT", check_breach_status=False)
+
+        assert weak.strength_rating_id == Rating.WEAK
+        assert strong.strength_rating_id == Rating.VERY_STRONG
+
+    def test_rating_id_follows_replace(self):
+        """strength_rating_id should track strength_rating after replace()."""
+        from dataclasses import replace
+
+        from securepass.cli.formatters import format_batch_summary
+
+        weak = analyze_password("password", check_breach_status=False)
+        upgraded = replace(weak, strength_rating="very_strong")
+
+        assert upgraded.strength_rating_id == Rating.VERY_STRONG
+        summary = format_batch_summary([upgraded])
+        assert "Weak:          0" in summary
+        assert "Very Strong:   1" in summary
+
+    def test_cached_results_independent(self):
+        """Repeated analyses should match but not share mutable fields."""
+        first = analyze_password("Tr0ub4dor&3", check_breach_status=False)
+        first.criteria_met["min_length"] = True
+        second = analyze_password("Tr0ub4dor&3", check_breach_status=False)
+        uncached = analyze_password(
+            "Tr0ub4dor&3", check_breach_status=False, use_cache=False
+        )
+
+        assert second.criteria_met["min_length"] is False
+        assert second.to_dict().keys() == uncached.to_dict().keys()
+        assert second.strength_score == uncached.strength_score
+
+    def test_cache_keyed_by_digest(self):
+        """The analysis cache should hold digests, never plaintext."""
+        from securepass.core import analyzer
+
+        analyzer.clear_analysis_cache()
+        result = analyze_password("Tr0ub4dor&3", check_breach_status=False)
+
+        assert list(analyzer._ANALYSIS_CACHE) == [result.password_hash]
+        assert "Tr0ub4dor&3" not in repr(analyzer._ANALYSIS_CACHE)
+
+        analyzer.clear_analysis_cache()
+        assert not analyzer._ANALYSIS_CACHE
+
+    def test_analyze_passwords_matches_single(self):
+        """Batch analysis should match per-password analysis, in order."""
+        passwords = ["password", "K7$mP9@nQ2#wX5zT", "password"]
+
+        results = analyze_passwords(passwords, check_breach_status=False)
+
+        assert [r.strength_score for r in results] == [
+            analyze_password(p, check_breach_status=False).strength_score
+            for p in passwords
+        ]
+        assert results[0] is not results[2]
+
+    def test_breach_adds_recommendation(self):
+        """A reported breach should add its warning to cached results."""
+        from unittest.mock import patch
+
+        clean = analyze_password("Tr0ub4dor&3", check_breach_status=False)
+        with patch("securepass.core.breach.check_breach", return_value=(True, 42)):
+            breached = analyze_password("Tr0ub4dor&3")
+
+        assert not any("breaches" in rec for rec in clean.recommendations)
+        assert any("42 data breaches" in rec for rec in breached.recommendations)
+        assert len(breached.recommendations) == len(clean.recommendations) + 1
+
     def test_password_hash_generated(self):
         """Password hash should be generated."""
         result = analyze_password("test123", check_breach_status=False)
@@ -220,6 +293,14 @@ class TestAnalyzePassword:
         assert result.timestamp is not None
         assert "T" in result.timestamp  # ISO 8601 format
 
+    def test_pickle_round_trip(self):
+        """Analyses should survive pickling (as sent to batch workers)."""
+        import pickle
+
+        result = analyze_password("test123", check_breach_status=False)
+
+        assert pickle.loads(pickle.dumps(result)) == result
+
     def test_recommendations_generated(self):
         """Recommendations should be generated."""
         result = analyze_password("weak", check_breach_status=False)
@@ -258,3 +339,75 @@ class TestAnalyzePassword:
 
         for criterion in expected_criteria:
             assert criterion in result.criteria_met
+
+
+class TestPasswordAnalysisExport:
+    """Tests for PasswordAnalysis serialization helpers."""
+
+    def test_to_json_round_trip(self):
+        """to_json should produce JSON equal to to_dict."""
+        import json
+
+        result = analyze_password("password", check_breach_status=False)
+
+        assert json.loads(result.to_json()) == result.to_dict()
+        assert json.loads(result.to_json(indent=4)) == result.to_dict()
+
+    def test_json_keeps_non_ascii(self, tmp_path):
+        """JSON output should be the same raw UTF-8 with or without orjson."""
+        import json
+        from dataclasses import replace
+
+        from securepass.cli.commands import _export_json
+
+        result = replace(
+            analyze_password("password", check_breach_status=False),
+            recommendations=["🚨 Évitez les mots courants"],
+        )
+        expected = json.dumps(result.to_dict(), indent=2, ensure_ascii=False)
+
+        assert result.to_json() == expected
+        path = tmp_path / "results.json"
+        _export_json([result], str(path))
+        text = path.read_text(encoding="utf-8")
+        assert "🚨 Évitez" in text
+        assert json.loads(text) == [result.to_dict()]
+
+    def test_write_csv(self):
+        """write_csv should emit the header then one row per analysis."""
+        import csv
+        import io
+
+        results = [
+            analyze_password(p, check_breach_status=False) for p in ["abc", "x,y"]
+        ]
+        buffer = io.StringIO(newline="")
+        PasswordAnalysis.write_csv(results, buffer)
+
+        rows = list(csv.reader(io.StringIO(buffer.getvalue())))
+        assert rows[0] == PasswordAnalysis.csv_header()
+        assert rows[1:] == [r.to_csv_row() for r in results]
+
+    def test_nonstandard_rating(self):
+        """Ratings outside the Rating enum should construct with id -1."""
+        from securepass.cli.formatters import format_batch_summary
+
+        fair = PasswordAnalysis(
+            password_hash="0" * 64,
+            timestamp="2024-01-01T00:00:00",
+            strength_score=50,
+            strength_rating="fair",
+            length=10,
+            entropy_bits=40.0,
+            character_pool_size=36,
+            criteria_met={},
+            breach_status={"found": False, "occurrence_count": 0},
+            recommendations=[],
+            estimated_crack_time={},
+        )
+
+        assert fair.strength_rating_id == -1
+        # Counted in the total but in none of the rating categories
+        summary = format_batch_summary([fair])
+        assert "Total Passwords Analyzed: 1" in summary
+        assert "Very Strong:   0" in summary
@@ -0,0 +1,59 @@
+"""
+Unit tests for Bloom filter module.
+
+Tests membership, false positive rate, and file round trips.
+"""
+
+import hashlib
+
+import pytest
+from securepass.utils.bloom import BloomFilter, build_from_hashes
+
+
+def _sha1(text):
+    """Uppercase SHA-1 hex digest of text."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest().upper()
+
+
+class TestBloomFilter:
+    """Tests for BloomFilter class."""
+
+    def test_no_false_negatives(self):
+        """Every added hash should be reported present."""
+        bloom = BloomFilter.for_capacity(1000)
+        hashes = [_sha1(str(i)) for i in range(1000)]
+        for sha1 in hashes:
+            bloom.add(sha1)
+
+        assert all(sha1 in bloom for sha1 in hashes)
+
+    def test_false_positive_rate(self):
+        """False positives should stay near the requested rate."""
+        bloom = BloomFilter.for_capacity(1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(_sha1(str(i)))
+
+        hits = sum(_sha1(f"other{i}") in bloom for i in range(10000))
+        assert hits < 300  # 1% target, generous bound
+
+    def test_save_and_load(self, tmp_path):
+        """A saved filter should load with identical answers."""
+        path = str(tmp_path / "hashes.bloom")
+        bloom = build_from_hashes(
+            [_sha1("password") + ":3861493", "not-a-hash", _sha1("letmein")], 2
+        )
+        bloom.save(path)
+
+        loaded = BloomFilter.load(path)
+
+        assert _sha1("password") in loaded
+        assert _sha1("letmein") in loaded
+        assert loaded.num_bits == bloom.num_bits
+
+    def test_load_rejects_other_files(self, tmp_path):
+        """Files without the filter header should be rejected."""
+        path = tmp_path / "junk.bin"
+        path.write_bytes(b"x" * 64)
+
+        with pytest.raises(ValueError):
+            BloomFilter.load(str(path))
@@ -7,7 +7,28 @@ using mocked responses.
 
 import pytest
 from unittest.mock import patch, Mock
-from securepass.core.breach import _sha1_hash, _api_request, check_breach
+from securepass.core.breach import (
+    _sha1_hash,
+    _api_request,
+    _parse_range,
+    check_breach,
+    check_breach_many,
+    clear_breach_cache,
+    create_session,
+    fetch_breach_ranges,
+    set_breach_filter,
+)
+from securepass.utils.bloom import BloomFilter
+
+
+@pytest.fixture(autouse=True)
+def _empty_breach_cache(monkeypatch):
+    """Start every test without cached HIBP responses or shared session."""
+    monkeypatch.setattr("securepass.core.breach._SESSION", None)
+    monkeypatch.setattr("securepass.core.breach._BLOOM", None)
+    clear_breach_cache()
+    yield
+    clear_breach_cache()
 
 
 class TestSHA1Hash:
@@ -55,15 +76,15 @@ class TestAPIRequest:
             "1E4C9B93F3F0682250B6CF8331B7EE68FD8:3861493\nABCDEF123456:100"
         )
         mock_response.raise_for_status = Mock()
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         # Make request
         suffixes = _api_request("5BAA6")
 
         # Verify
         assert len(suffixes) == 2
-        assert suffixes[0] == ("1E4C9B93F3F0682250B6CF8331B7EE68FD8", 3861493)
-        assert suffixes[1] == ("ABCDEF123456", 100)
+        assert suffixes["1E4C9B93F3F0682250B6CF8331B7EE68FD8"] == 3861493
+        assert suffixes["ABCDEF123456"] == 100
 
     @patch("securepass.core.breach.requests")
     def test_request_headers(self, mock_requests):
@@ -71,20 +92,55 @@ class TestAPIRequest:
         mock_response = Mock()
         mock_response.text = ""
         mock_response.raise_for_status = Mock()
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
 
         _api_request("5BAA6")
 
         # Verify headers were set
-        call_kwargs = mock_requests.get.call_args[1]
+        call_kwargs = mock_requests.Session.return_value.get.call_args[1]
         assert "headers" in call_kwargs
         assert "User-Agent" in call_kwargs["headers"]
 
+    @patch("securepass.core.breach.requests")
+    def test_session_reused(self, mock_requests):
+        """A supplied session should be used instead of the shared one."""
+        session = Mock()
+        session.get.return_value.text = "ABCDEF123456:100"
+
+        suffixes = _api_request("5BAA6", session=session)
+
+        assert suffixes == {"ABCDEF123456": 100}
+        session.get.assert_called_once()
+        mock_requests.Session.assert_not_called()
+
+    @patch("securepass.core.breach.requests")
+    def test_shared_session_kept_alive(self, mock_requests):
+        """Calls without a session should reuse one module-level session."""
+        mock_requests.Session.return_value.get.return_value.text = ""
+
+        _api_request("5BAA6")
+        _api_request("E38AD")
+
+        mock_requests.Session.assert_called_once()
+        assert mock_requests.Session.return_value.get.call_count == 2
+
+    def test_session_pools_and_retries(self):
+        """Sessions should pool connections and retry transient failures."""
+        adapter = create_session(pool_size=4).get_adapter(
+            "https://api.pwnedpasswords.com/range/5BAA6"
+        )
+
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 2
+        assert 429 in adapter.max_retries.status_forcelist
+
     @patch("securepass.core.breach.requests")
     def test_timeout_handling(self, mock_requests):
         """Test timeout error handling."""
         mock_requests.Timeout = Exception  # Mock the Timeout exception class
-        mock_requests.get.side_effect = mock_requests.Timeout("Timeout")
+        mock_requests.Session.return_value.get.side_effect = mock_requests.Timeout(
+            "Timeout"
+        )
         mock_requests.RequestException = Exception
 
         with pytest.raises(Exception):
@@ -94,13 +150,33 @@ class TestAPIRequest:
     def test_connection_error_handling(self, mock_requests):
         """Test connection error handling."""
         mock_requests.ConnectionError = Exception
-        mock_requests.get.side_effect = mock_requests.ConnectionError("No connection")
+        mock_requests.Session.return_value.get.side_effect = (
+            mock_requests.ConnectionError("No connection")
+        )
         mock_requests.RequestException = Exception
 
         with pytest.raises(Exception):
             _api_request("5BAA6")
 
 
+class TestParseRange:
+    """Tests for _parse_range function."""
+
+    def test_crlf_body(self):
+        """CRLF-separated bodies should parse into a suffix -> count map."""
+        body = "1E4C9B93F3F0682250B6CF8331B7EE68FD8:3861493\r\nABCDEF123456:0\r\n"
+
+        assert _parse_range(body) == {
+            "1E4C9B93F3F0682250B6CF8331B7EE68FD8": 3861493,
+            "ABCDEF123456": 0,
+        }
+
+    def test_stray_lines_skipped(self):
+        """Lines without a separator should be ignored."""
+        assert _parse_range("\nABCDEF:5\n\nGARBAGE\n") == {"ABCDEF": 5}
+        assert _parse_range("") == {}
+
+
 class TestCheckBreach:
     """Tests for check_breach function (main integration)."""
 
@@ -117,10 +193,10 @@ class TestCheckBreach:
         # Hash: 5BAA61E4C9B93F3F0682250B6CF8331B7EE68FD8
         # Prefix: 5BAA6
         # Suffix: 1E4C9B93F3F0682250B6CF8331B7EE68FD8
-        mock_api.return_value = [
-            ("1E4C9B93F3F0682250B6CF8331B7EE68FD8", 3861493),
-            ("ABCDEF123456", 100),
-        ]
+        mock_api.return_value = {
+            "1E4C9B93F3F0682250B6CF8331B7EE68FD8": 3861493,
+            "ABCDEF123456": 100,
+        }
 
         is_breached, count = check_breach("password")
 
@@ -136,7 +212,7 @@ class TestCheckBreach:
     def test_password_not_found(self, mock_api):
         """Test password not in breach database."""
         # Mock API response with different suffixes
-        mock_api.return_value = [("ABCDEF123456", 100), ("FEDCBA654321", 50)]
+        mock_api.return_value = {"ABCDEF123456": 100, "FEDCBA654321": 50}
 
         is_breached, count = check_breach("uniquepassword123")
 
@@ -146,7 +222,7 @@ class TestCheckBreach:
     @patch("securepass.core.breach._api_request")
     def test_k_anonymity_implementation(self, mock_api):
         """Test that k-anonymity is properly implemented."""
-        mock_api.return_value = []
+        mock_api.return_value = {}
 
         # Check a password
         check_breach("testpassword")
@@ -155,14 +231,15 @@ class TestCheckBreach:
         call_args = mock_api.call_args[0]
         assert len(call_args[0]) == 5
 
+    @patch("securepass.core.breach.time.sleep")
     @patch("securepass.core.breach._api_request")
-    def test_retry_on_failure(self, mock_api):
+    def test_retry_on_failure(self, mock_api, mock_sleep):
         """Test retry logic on failure."""
         # First two calls fail, third succeeds
         mock_api.side_effect = [
             Exception("Network error"),
             Exception("Network error"),
-            [],
+            {},
         ]
 
         is_breached, count = check_breach("password", max_retries=3)
@@ -172,8 +249,12 @@ class TestCheckBreach:
         assert is_breached is False
         assert count == 0
 
+        # Exponential backoff between attempts (patched out, not slept)
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2]
+
+    @patch("securepass.core.breach.time.sleep")
     @patch("securepass.core.breach._api_request")
-    def test_max_retries_exhausted(self, mock_api):
+    def test_max_retries_exhausted(self, mock_api, mock_sleep):
         """Test behavior when all retries fail."""
         mock_api.side_effect = Exception("Network error")
 
@@ -183,17 +264,104 @@ class TestCheckBreach:
         assert is_breached is False
         assert count == 0
         assert mock_api.call_count == 2
+        mock_sleep.assert_called_once_with(1)
 
     @patch("securepass.core.breach._api_request")
     def test_case_sensitivity_hash_matching(self, mock_api):
         """Test that hash matching is case-sensitive (as it should be)."""
         # Mock with lowercase suffix
-        mock_api.return_value = [
-            ("1e4c9b93f3f0682250b6cf8331b7ee68fd8", 100)  # lowercase
-        ]
+        mock_api.return_value = {
+            "1e4c9b93f3f0682250b6cf8331b7ee68fd8": 100  # lowercase
+        }
 
         is_breached, count = check_breach("password")
 
         # Should not match because our hash is uppercase
         # and the mock returned lowercase
         assert is_breached is False
+
+
+class TestFetchBreachRanges:
+    """Tests for fetch_breach_ranges and check_breach cache usage."""
+
+    @patch("securepass.core.breach._api_request")
+    def test_one_request_per_prefix(self, mock_api):
+        """Duplicate passwords should share a single prefix request."""
+        mock_api.return_value = {"1E4C9B93F3F0682250B6CF8331B7EE68FD8": 3861493}
+
+        sha1 = _sha1_hash("password")
+        ranges = fetch_breach_ranges([sha1, sha1])
+
+        mock_api.assert_called_once()
+        assert ranges == {"5BAA6": {"1E4C9B93F3F0682250B6CF8331B7EE68FD8": 3861493}}
+
+    @patch("securepass.core.breach._api_request")
+    def test_failed_prefix_omitted(self, mock_api):
+        """Prefixes whose request fails should be left out of the cache."""
+        mock_api.side_effect = Exception("Network error")
+
+        assert fetch_breach_ranges([_sha1_hash("password")]) == {}
+
+    @patch("securepass.core.breach._api_request")
+    def test_check_breach_uses_cache(self, mock_api):
+        """Cached prefixes should be answered without calling the API."""
+        cache = {"5BAA6": {"1E4C9B93F3F0682250B6CF8331B7EE68FD8": 3861493}}
+
+        assert check_breach("password", breach_cache=cache) == (True, 3861493)
+        assert check_breach("password1", breach_cache={"E38AD": {}}) == (False, 0)
+        mock_api.assert_not_called()
+
+    @patch("securepass.core.breach._api_request")
+    def test_precomputed_hash_used(self, mock_api):
+        """A supplied sha1_hex should be used instead of rehashing."""
+        mock_api.return_value = {"1E4C9B93F3F0682250B6CF8331B7EE68FD8": 3861493}
+
+        sha1 = _sha1_hash("password")
+        assert check_breach("ignored", sha1_hex=sha1) == (True, 3861493)
+        assert mock_api.call_args[0][0] == "5BAA6"
+
+    @patch("securepass.core.breach._api_request")
+    def test_prefix_cached_between_checks(self, mock_api):
+        """A fetched range should answer later checks sharing the prefix."""
+        mock_api.return_value = {"1E4C9B93F3F0682250B6CF8331B7EE68FD8": 3861493}
+
+        assert check_breach("password") == (True, 3861493)
+        assert check_breach("password") == (True, 3861493)
+        assert fetch_breach_ranges([_sha1_hash("password")])["5BAA6"]
+        mock_api.assert_called_once()
+
+    @patch("securepass.core.breach._api_request")
+    def test_check_breach_many(self, mock_api):
+        """check_breach_many should resolve each password from one fetch."""
+        mock_api.return_value = {"1E4C9B93F3F0682250B6CF8331B7EE68FD8": 3861493}
+
+        results = check_breach_many(["password", "", "password"])
+
+        assert results == [(True, 3861493), (False, 0), (True, 3861493)]
+        mock_api.assert_called_once()
+
+
+class TestBreachFilter:
+    """Tests for the optional Bloom filter pre-check."""
+
+    @patch("securepass.core.breach._api_request")
+    def test_filter_negative_skips_api(self, mock_api):
+        """Hashes absent from the filter should not reach the API."""
+        bloom = BloomFilter.for_capacity(10)
+        bloom.add(_sha1_hash("password"))
+        set_breach_filter(bloom)
+        mock_api.return_value = {"1E4C9B93F3F0682250B6CF8331B7EE68FD8": 3861493}
+
+        assert check_breach("xK9#mQ2$pL5@nW8") == (False, 0)
+        mock_api.assert_not_called()
+        assert check_breach("password") == (True, 3861493)
+        mock_api.assert_called_once()
+
+    @patch("securepass.core.breach._api_request")
+    def test_filter_prunes_prefetch(self, mock_api):
+        """fetch_breach_ranges should only request filter-positive hashes."""
+        set_breach_filter(BloomFilter.for_capacity(10))
+        mock_api.return_value = {}
+
+        assert fetch_breach_ranges([_sha1_hash("password")]) == {}
+        mock_api.assert_not_called()
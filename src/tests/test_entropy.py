@@ -4,48 +4,67 @@ Unit tests for entropy calculator module.
 Tests pool size detection, entropy calculation, and crack time estimation.
 """
 
+import math
+
 import pytest
 from securepass.core.entropy import (
+    CLASS_LOWER,
+    CLASS_UPPER,
+    CLASS_DIGIT,
+    CLASS_SYMBOL,
+    character_class_mask,
     get_character_pool_size,
     calculate_entropy,
     estimate_crack_time,
     _format_time,
 )
 
+# log2(pool) * length for each (pool size, length) the tests check
+EXPECTED_ENTROPY = {
+    (26, 8): math.log2(26) * 8,  # ~37.6 bits
+    (94, 8): math.log2(94) * 8,  # ~52.4 bits
+    (26, 128): math.log2(26) * 128,  # ~601 bits
+}
+
 
 class TestCharacterPoolSize:
     """Tests for get_character_pool_size function."""
 
-    def test_empty_password(self):
-        """Empty password should return 0."""
-        assert get_character_pool_size("") == 0
-
-    def test_lowercase_only(self):
-        """Only lowercase letters should return 26."""
-        assert get_character_pool_size("password") == 26
-        assert get_character_pool_size("abcdefghijklmnopqrstuvwxyz") == 26
-
-    def test_uppercase_only(self):
-        """Only uppercase letters should return 26."""
-        assert get_character_pool_size("PASSWORD") == 26
-        assert get_character_pool_size("ABCDEFGHIJKLMNOPQRSTUVWXYZ") == 26
-
-    def test_digits_only(self):
-        """Only digits should return 10."""
-        assert get_character_pool_size("1234567890") == 10
-
-    def test_symbols_only(self):
-        """Only symbols should return 32."""
-        assert get_character_pool_size("!@#$%^&*()") == 32
-
-    def test_mixed_lower_upper(self):
-        """Lowercase + uppercase should return 52."""
-        assert get_character_pool_size("Password") == 52
-
-    def test_mixed_all_types(self):
-        """All character types should return 94."""
-        assert get_character_pool_size("P@ssw0rd!") == 94
-        assert get_character_pool_size("Abc123!@#") == 94
+    @pytest.mark.parametrize(
+        "password,expected",
+        [
+            ("", 0),  # empty
+            ("password", 26),  # lowercase only
+            ("abcdefghijklmnopqrstuvwxyz", 26),
+            ("PASSWORD", 26),  # uppercase only
+            ("ABCDEFGHIJKLMNOPQRSTUVWXYZ", 26),
+            ("1234567890", 10),  # digits only
+            ("!@#$%^&*()", 32),  # symbols only
+            ("Password", 52),  # lowercase + uppercase
+            ("P@ssw0rd!", 94),  # all character types
+            ("Abc123!@#", 94),
+        ],
+    )
+    def test_pool_size(self, password, expected):
+        """Pool size should sum the sizes of the classes present."""
+        assert get_character_pool_size(password) == expected
+
+
+class TestCharacterClassMask:
+    """Tests for character_class_mask function."""
+
+    def test_each_class(self):
+        """Each character class should set its own bit."""
+        assert character_class_mask("abc") == CLASS_LOWER
+        assert character_class_mask("ABC") == CLASS_UPPER
+        assert character_class_mask("123") == CLASS_DIGIT
+        assert character_class_mask("!@#") == CLASS_SYMBOL
+        assert character_class_mask("") == 0
+
+    def test_non_ascii_ignored(self):
+        """Non-ASCII characters should not count toward any class."""
+        assert character_class_mask("éü中😀") == 0
+        assert get_character_pool_size("café") == 26
 
 
 class TestCalculateEntropy:
@@ -63,109 +82,68 @@ class TestCalculateEntropy:
         assert pool == 26
         assert entropy > 0
 
-    def test_known_entropy_lowercase(self):
-        """Test entropy calculation for lowercase password."""
-        # "password" = 8 chars, pool size 26
-        # Entropy = log2(26) * 8 ≈ 37.6 bits
-        entropy, pool = calculate_entropy("password")
-        assert pool == 26
-        assert 37.0 < entropy < 38.0
-
-    def test_known_entropy_mixed(self):
-        """Test entropy calculation for mixed password."""
-        # "P@ssw0rd" = 8 chars, pool size 94
-        # Entropy = log2(94) * 8 ≈ 52.4 bits
-        entropy, pool = calculate_entropy("P@ssw0rd")
-        assert pool == 94
-        assert 52.0 < entropy < 53.0
-
-    def test_very_long_password(self):
-        """Very long password should have high entropy."""
-        long_pwd = "a" * 128
-        entropy, pool = calculate_entropy(long_pwd)
-        assert pool == 26
-        assert entropy > 500  # log2(26) * 128 ≈ 601
+    @pytest.mark.parametrize(
+        "password,expected_pool",
+        [
+            ("password", 26),  # lowercase
+            ("P@ssw0rd", 94),  # mixed
+            ("a" * 128, 26),  # very long
+        ],
+    )
+    def test_known_entropy(self, password, expected_pool):
+        """Entropy should be log2(pool size) bits per character."""
+        entropy, pool = calculate_entropy(password)
+        assert pool == expected_pool
+        assert entropy == pytest.approx(
+            EXPECTED_ENTROPY[(pool, len(password))], rel=0.01
+        )
 
 
 class TestEstimateCrackTime:
     """Tests for estimate_crack_time function."""
 
-    def test_zero_entropy(self):
-        """Zero entropy should return 'instant'."""
-        times = estimate_crack_time(0)
-        assert times["online_attack_100_per_second"] == "instant"
-        assert times["offline_attack_10B_per_second"] == "instant"
-
-    def test_negative_entropy(self):
-        """Negative entropy should return 'instant'."""
-        times = estimate_crack_time(-10)
-        assert times["online_attack_100_per_second"] == "instant"
-        assert times["offline_attack_10B_per_second"] == "instant"
-
-    def test_low_entropy(self):
-        """Low entropy (20 bits) should crack quickly."""
-        times = estimate_crack_time(20)
-        # 2^20 = 1,048,576 combinations
-        # Online: 1,048,576 / 100 = 10,485 seconds ≈ 2.9 hours
-        # Offline: 1,048,576 / 10B = instant
-        assert (
-            "hours" in times["online_attack_100_per_second"]
-            or "minutes" in times["online_attack_100_per_second"]
-        )
-        assert (
-            "instant" in times["offline_attack_10B_per_second"]
-            or "seconds" in times["offline_attack_10B_per_second"]
-        )
-
-    def test_medium_entropy(self):
-        """Medium entropy (40 bits) should take longer."""
-        times = estimate_crack_time(40)
-        # 2^40 = ~1 trillion combinations
-        assert (
-            "years" in times["online_attack_100_per_second"]
-            or "centuries" in times["online_attack_100_per_second"]
-        )
-
-    def test_high_entropy(self):
-        """High entropy (80 bits) should be very secure."""
-        times = estimate_crack_time(80)
-        # 2^80 = massive number
-        assert (
-            "years" in times["online_attack_100_per_second"]
-            or "centuries" in times["online_attack_100_per_second"]
-            or "millennia" in times["online_attack_100_per_second"]
-        )
+    @pytest.mark.parametrize(
+        "bits,online_units,offline_units",
+        [
+            (0, {"instant"}, {"instant"}),  # zero entropy
+            (-10, {"instant"}, {"instant"}),  # negative entropy
+            # 2^20 guesses: ~2.9 hours online, instant offline
+            (20, {"hours", "minutes"}, {"instant", "seconds"}),
+            # 2^40 = ~1 trillion combinations
+            (40, {"years", "centuries"}, None),
+            # 2^80 = massive number
+            (80, {"years", "centuries", "millennia"}, None),
+        ],
+    )
+    def test_time_units(self, bits, online_units, offline_units):
+        """Crack times should be reported in units matching the entropy."""
+        times = estimate_crack_time(bits)
+        # The unit is the last word ("2.9 hours" -> "hours", "instant")
+        assert times["online_attack_100_per_second"].split()[-1] in online_units
+        if offline_units is not None:
+            assert times["offline_attack_10B_per_second"].split()[-1] in offline_units
 
 
 class TestFormatTime:
     """Tests for _format_time helper function."""
 
-    def test_instant(self):
+    @pytest.mark.parametrize("seconds", [0, 0.0001])
+    def test_instant(self, seconds):
         """Very small values should be 'instant'."""
-        assert _format_time(0) == "instant"
-        assert _format_time(0.0001) == "instant"
-
-    def test_seconds(self):
-        """Seconds range."""
-        assert "seconds" in _format_time(1.5)
-        assert "seconds" in _format_time(30)
-
-    def test_minutes(self):
-        """Minutes range."""
-        assert "minutes" in _format_time(120)  # 2 minutes
-
-    def test_hours(self):
-        """Hours range."""
-        assert "hours" in _format_time(7200)  # 2 hours
-
-    def test_days(self):
-        """Days range."""
-        assert "days" in _format_time(172800)  # 2 days
-
-    def test_years(self):
-        """Years range."""
-        assert "years" in _format_time(63072000)  # 2 years
-
-    def test_centuries(self):
-        """Centuries range."""
-        assert "centuries" in _format_time(6307200000)  # 200 years
+        assert _format_time(seconds) == "instant"
+
+    @pytest.mark.parametrize(
+        "seconds,unit",
+        [
+            (1.5, "seconds"),
+            (30, "seconds"),
+            (120, "minutes"),  # 2 minutes
+            (7200, "hours"),  # 2 hours
+            (172800, "days"),  # 2 days
+            (63072000, "years"),  # 2 years
+            (6307200000, "centuries"),  # 200 years
+        ],
+    )
+    def test_unit(self, seconds, unit):
+        """Each range should be reported in its own unit."""
+        assert unit in _format_time(seconds)
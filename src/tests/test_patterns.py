@@ -14,84 +14,79 @@ from securepass.utils.patterns import (
     COMMON_PATTERNS,
     KEYBOARD_PATTERNS,
 )
+from securepass.utils.matcher import scan_patterns
+from securepass.utils import wordlist
+from securepass.utils.wordlist import contains_dictionary_word
 
 
 class TestHasCommonPattern:
     """Tests for has_common_pattern function."""
 
-    def test_empty_password(self):
-        """Empty password should return False."""
-        assert has_common_pattern("") is False
-
-    def test_exact_match(self):
-        """Exact match of common pattern."""
-        assert has_common_pattern("password") is True
-        assert has_common_pattern("123456") is True
-        assert has_common_pattern("qwerty") is True
-
-    def test_case_insensitive(self):
-        """Should be case-insensitive."""
-        assert has_common_pattern("PASSWORD") is True
-        assert has_common_pattern("PaSsWoRd") is True
-
-    def test_pattern_within_password(self):
-        """Pattern contained within larger password."""
-        assert has_common_pattern("password123") is True
-        assert has_common_pattern("mypassword") is True
-        assert has_common_pattern("123456789") is True
-
-    def test_no_common_pattern(self):
-        """Strong password with no common patterns."""
-        assert has_common_pattern("K7$mP9@nQ2") is False
-        assert has_common_pattern("xK9#mQ2$pL") is False
+    @pytest.mark.parametrize(
+        "password,expected",
+        [
+            ("", False),  # empty
+            ("password", True),  # exact matches
+            ("123456", True),
+            ("qwerty", True),
+            ("PASSWORD", True),  # case-insensitive
+            ("PaSsWoRd", True),
+            ("password123", True),  # contained in a longer password
+            ("mypassword", True),
+            ("123456789", True),
+            ("K7$mP9@nQ2", False),  # no common pattern
+            ("xK9#mQ2$pL", False),
+        ],
+    )
+    def test_has_common_pattern(self, password, expected):
+        """Common patterns should be found anywhere, ignoring case."""
+        assert has_common_pattern(password) is expected
 
 
 class TestHasSequentialChars:
     """Tests for has_sequential_chars function."""
 
-    def test_empty_password(self):
-        """Empty password should return False."""
-        assert has_sequential_chars("") is False
-
-    def test_too_short(self):
-        """Password shorter than min_length should return False."""
-        assert has_sequential_chars("ab", min_length=3) is False
-
-    def test_alphabetic_sequence(self):
-        """Detect alphabetic sequences."""
-        assert has_sequential_chars("abc") is True
-        assert has_sequential_chars("xyz") is True
-        assert has_sequential_chars("defgh") is True
-        assert has_sequential_chars("password_abc_test") is True
-
-    def test_numeric_sequence(self):
-        """Detect numeric sequences."""
-        assert has_sequential_chars("123") is True
-        assert has_sequential_chars("456789") is True
-        assert has_sequential_chars("pass123word") is True
-
-    def test_reverse_sequence(self):
-        """Detect reverse sequences."""
-        assert has_sequential_chars("cba") is True
-        assert has_sequential_chars("321") is True
-        assert has_sequential_chars("zyx") is True
-
-    def test_uppercase_sequence(self):
-        """Detect uppercase sequences."""
-        assert has_sequential_chars("ABC") is True
-        assert has_sequential_chars("XYZ") is True
-
-    def test_no_sequence(self):
-        """No sequential characters."""
-        assert has_sequential_chars("a1b2c3") is False
-        assert has_sequential_chars("password") is False
-        assert has_sequential_chars("K7$mP9@n") is False
-
-    def test_custom_min_length(self):
-        """Test with custom minimum length."""
-        assert has_sequential_chars("ab", min_length=2) is True
-        assert has_sequential_chars("abcd", min_length=4) is True
-        assert has_sequential_chars("abc", min_length=4) is False
+    @pytest.mark.parametrize(
+        "password,expected",
+        [
+            ("", False),  # empty
+            ("ab", False),  # shorter than the default min_length of 3
+            ("abc", True),  # alphabetic
+            ("xyz", True),
+            ("defgh", True),
+            ("password_abc_test", True),
+            ("123", True),  # numeric
+            ("456789", True),
+            ("pass123word", True),
+            ("cba", True),  # reverse
+            ("321", True),
+            ("zyx", True),
+            ("ABC", True),  # uppercase
+            ("XYZ", True),
+            ("a1b2c3", False),  # no sequence
+            ("password", False),
+            ("K7$mP9@n", False),
+            ("xαβγx", True),  # by code point, including outside ASCII
+            ("éabc", True),
+            ("αγε", False),
+        ],
+    )
+    def test_has_sequential_chars(self, password, expected):
+        """Ascending or descending runs of 3 should be detected."""
+        assert has_sequential_chars(password) is expected
+
+    @pytest.mark.parametrize(
+        "password,min_length,expected",
+        [
+            ("ab", 3, False),  # too short
+            ("ab", 2, True),
+            ("abcd", 4, True),
+            ("abc", 4, False),
+        ],
+    )
+    def test_custom_min_length(self, password, min_length, expected):
+        """Runs should be measured against a custom minimum length."""
+        assert has_sequential_chars(password, min_length=min_length) is expected
 
 
 class TestHasRepeatedChars:
@@ -137,31 +132,109 @@ class TestHasRepeatedChars:
 class TestIsKeyboardPattern:
     """Tests for is_keyboard_pattern function."""
 
-    def test_empty_password(self):
-        """Empty password should return False."""
-        assert is_keyboard_pattern("") is False
-
-    def test_qwerty_pattern(self):
-        """Detect QWERTY keyboard patterns."""
-        assert is_keyboard_pattern("qwerty") is True
-        assert is_keyboard_pattern("QWERTY") is True
-        assert is_keyboard_pattern("qwerty123") is True
-
-    def test_asdf_pattern(self):
-        """Detect ASDF keyboard patterns."""
-        assert is_keyboard_pattern("asdfgh") is True
-        assert is_keyboard_pattern("asdf") is True
-
-    def test_other_keyboard_patterns(self):
-        """Detect other keyboard patterns."""
-        assert is_keyboard_pattern("zxcvbn") is True
-        assert is_keyboard_pattern("qazwsx") is True
-
-    def test_no_keyboard_pattern(self):
-        """No keyboard patterns."""
-        assert is_keyboard_pattern("password") is False
-        assert is_keyboard_pattern("K7$mP9@n") is False
-        assert is_keyboard_pattern("random123") is False
+    @pytest.mark.parametrize(
+        "password,expected",
+        [
+            ("", False),  # empty
+            ("qwerty", True),  # QWERTY row
+            ("QWERTY", True),
+            ("qwerty123", True),
+            ("asdfgh", True),  # ASDF row
+            ("asdf", True),
+            ("zxcvbn", True),  # other walks
+            ("qazwsx", True),
+            ("password", False),  # no keyboard pattern
+            ("K7$mP9@n", False),
+            ("random123", False),
+        ],
+    )
+    def test_is_keyboard_pattern(self, password, expected):
+        """Keyboard walks should be found anywhere, ignoring case."""
+        assert is_keyboard_pattern(password) is expected
+
+
+class TestPatternRegexes:
+    """Tests that the trie regexes match exactly the listed patterns."""
+
+    PASSWORDS = ["qwerty123", "asdf2024", "password", "K7$mP9@n", "QAZWSX", ""]
+
+    def test_matches_substring_oracle(self):
+        """Both checks should agree with plain substring tests."""
+        # Every pattern embedded in noise and upper-cased, plus near misses
+        candidates = self.PASSWORDS + [
+            variant
+            for pattern in COMMON_PATTERNS + KEYBOARD_PATTERNS
+            for variant in (f"x{pattern.upper()}9", pattern[:-1], pattern[1:])
+        ]
+        for password in candidates:
+            lower = password.lower()
+            assert has_common_pattern(password) is any(
+                pattern in lower for pattern in COMMON_PATTERNS
+            ), password
+            assert is_keyboard_pattern(password) is any(
+                pattern in lower for pattern in KEYBOARD_PATTERNS
+            ), password
+
+
+class TestScanPatterns:
+    """Tests for the combined scan_patterns matcher."""
+
+    def test_matches_separate_checks(self):
+        """Should agree with has_common_pattern and contains_dictionary_word."""
+        for password in [
+            "password123",
+            "MyDragon!",
+            "xK9#mQ2$pL",
+            "Passw0rd1",
+            "iloveyou2024",
+            "",
+        ]:
+            assert scan_patterns(password) == (
+                has_common_pattern(password),
+                contains_dictionary_word(password),
+            )
+
+    def test_precomputed_lowercase(self):
+        """Passing password_lower should not change any result."""
+        for password in ["PassWord123", "QWERTYuiop", "xK9#mQ2$pL"]:
+            lower = password.lower()
+            assert scan_patterns(password, lower) == scan_patterns(password)
+            assert has_common_pattern(password, lower) is has_common_pattern(password)
+            assert is_keyboard_pattern(password, lower) is is_keyboard_pattern(password)
+            assert contains_dictionary_word(
+                password, lower
+            ) is contains_dictionary_word(password)
+
+    def test_overlapping_words(self):
+        """Words hidden behind a longer match at the same position count."""
+        assert scan_patterns("password1")[0] is True
+        assert scan_patterns("zzADMINzz") == (True, has_common_pattern("admin"))
+
+
+class TestContainsDictionaryWord:
+    """Tests for dictionary substring matching."""
+
+    PASSWORDS = ["password", "PASSWORD", "xxDragonxx", "MyP@ssw0rd", "xK9#mQ2$pL"]
+
+    def test_wordlist_loaded_once(self):
+        """Repeated loads should return the same cached frozenset."""
+        assert wordlist.load_wordlist() is wordlist.load_wordlist()
+        assert isinstance(wordlist.load_wordlist(), frozenset)
+
+    def test_substring_words_are_minimal(self):
+        """Substring scan words are 4+ chars and contain no other scan word."""
+        words = wordlist.substring_words()
+        assert "password" in words
+        assert "password1" not in words
+        for word in words:
+            assert len(word) >= 4
+            assert not any(other in word for other in words if other != word)
+
+    def test_agrees_with_scan_patterns(self):
+        """Should report the dictionary half of the shared matcher scan."""
+        results = [contains_dictionary_word(p) for p in self.PASSWORDS]
+        assert results == [scan_patterns(p)[1] for p in self.PASSWORDS]
+        assert results == [True, True, True, False, False]
 
 
 class TestPatternConstants: